@@ -0,0 +1,34 @@
+"""Benchmark memori: MLMSystem (dict per user) vs CompactMLMSystem (struct-of-arrays).
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_memory [jumlah_anggota]
+"""
+import sys
+import tracemalloc
+
+from benchmarks.generators import random_tree
+from compact_store import CompactMLMSystem
+from mlm_core import MLMSystem
+
+
+def measure(factory, size, seed=0):
+    """Mengembalikan jumlah byte yang dialokasikan untuk membangun jaringan berukuran `size`."""
+    rows = list(random_tree(size, seed))
+    tracemalloc.start()
+    mlm = factory()
+    for row in rows:
+        mlm.add_user(*row)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main(size):
+    print(f"{'layout':>20} {'total (MB)':>12} {'byte/anggota':>14}")
+    for name, factory in (('dict (MLMSystem)', MLMSystem), ('compact', CompactMLMSystem)):
+        used = measure(factory, size)
+        print(f"{name:>20} {used / 2**20:>12.1f} {used / size:>14.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,50 @@
+"""Benchmark payout paralel per subtree dibandingkan engine NumPy satu proses.
+
+Jalankan dari root repo (idealnya pada mesin 8 core):
+    python -m benchmarks.bench_parallel [jumlah_anggota] [workers ...]
+"""
+import sys
+import time
+
+from benchmarks.generators import random_tree
+from payout_numpy import PayoutColumns, calculate_rewards_vectorized
+from payout_parallel import ParallelPayout
+from mlm_core import MLMSystem
+
+
+def build_network(size, seed=0):
+    """Hutan acak: sebagian kecil anggota adalah sponsor tingkat atas tanpa referrer."""
+    mlm = MLMSystem()
+    mlm.add_users(random_tree(size, seed, root_probability=0.001))
+    return mlm
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(size, worker_counts):
+    mlm = build_network(size)
+    columns = PayoutColumns.from_system(mlm)
+    stakes = [details['staking'] for details in mlm.users.values()]
+    columns.depths()  # Topologi di-cache, sama seperti pemanggilan kedua pada MLMSystem
+
+    serial = timed(calculate_rewards_vectorized, columns, stakes, 30)
+    print(f"{'engine':>16} {'siapkan (s)':>12} {'waktu (s)':>10} {'speedup':>8}")
+    print(f"{'numpy 1 proses':>16} {0:>12.3f} {serial:>10.3f} {1:>8.2f}")
+    for workers in worker_counts:
+        # Pool dan shared memory dibuat sekali, lalu dipakai ulang seperti pada MLMSystem(workers=...)
+        start = time.perf_counter()
+        with ParallelPayout(columns, workers) as engine:
+            engine.run(stakes, 30)
+            setup = time.perf_counter() - start
+            elapsed = timed(engine.run, stakes, 30)
+        print(f"{f'paralel {workers}':>16} {setup:>12.3f} {elapsed:>10.3f} {serial / elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or [2, 4, 8]
+    main(size, worker_counts)
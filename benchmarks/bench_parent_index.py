@@ -0,0 +1,36 @@
+"""Benchmark waktu payout terhadap ukuran jaringan.
+
+Dengan indeks parent, setiap hop upline bernilai O(1) sehingga waktu
+`calculate_rewards` seharusnya tumbuh linear terhadap jumlah anggota.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_parent_index [ukuran ...]
+"""
+import sys
+import time
+
+from benchmarks.generators import random_tree
+from mlm_core import MLMSystem
+
+
+def build_network(size, seed=0):
+    """Membangun jaringan acak: setiap anggota baru mereferensikan anggota sebelumnya."""
+    mlm = MLMSystem()
+    for row in random_tree(size, seed):
+        mlm.add_user(*row)
+    return mlm
+
+
+def main(sizes):
+    print(f"{'anggota':>10} {'payout (s)':>12} {'us/anggota':>12}")
+    for size in sizes:
+        mlm = build_network(size)
+        start = time.perf_counter()
+        mlm.calculate_rewards(30)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10} {elapsed:>12.4f} {elapsed / size * 1e6:>12.3f}")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [12500, 25000, 50000, 100000, 200000]
+    main(sizes)
@@ -0,0 +1,86 @@
+"""Load generator untuk payout_service: latensi p50/p99 untuk campuran baca/tulis.
+
+Server dijalankan di proses yang sama pada port acak, lalu `concurrency` klien
+keep-alive mengirim request secara bersamaan; sebagian kecil adalah payout penuh.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_service [jumlah_anggota] [jumlah_request] [concurrency]
+"""
+import asyncio
+import json
+import random
+import sys
+import time
+
+from benchmarks.generators import random_tree
+from mlm_core import MLMSystem
+from payout_service import PayoutService, serve
+
+
+async def _request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':')[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(port, requests, size, seed, latencies):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for i in range(requests):
+        roll = rng.random()
+        if roll < 0.8:
+            kind, args = 'read', ('GET', f"/report?user_id=u{rng.randrange(size)}")
+        elif roll < 0.99:
+            kind, args = 'join', ('POST', '/users', {'user_id': f"c{seed}_{i}", 'staking': 1000,
+                                                     'referrer': f"u{rng.randrange(size)}"})
+        else:
+            kind, args = 'payout', ('POST', '/payout', {'days': 30})
+        start = time.perf_counter()
+        await _request(reader, writer, *args)
+        latencies.setdefault(kind, []).append(time.perf_counter() - start)
+    writer.close()
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+async def main(size, requests, concurrency):
+    mlm = MLMSystem(incremental=True)
+    mlm.add_users(random_tree(size))
+    mlm.calculate_rewards(30)
+    service = PayoutService(mlm)
+    server = await serve(service, port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    latencies = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(port, requests // concurrency, size, seed, latencies) for seed in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    await service.stop()
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total} request dalam {elapsed:.2f}s ({total / elapsed:,.0f} req/detik), {concurrency} klien")
+    print(f"{'jenis':>8} {'jumlah':>8} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for kind, values in sorted(latencies.items()):
+        print(f"{kind:>8} {len(values):>8} {_percentile(values, 0.5) * 1e3:>10.2f} {_percentile(values, 0.99) * 1e3:>10.2f}")
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    asyncio.run(main(size, requests, concurrency))
@@ -0,0 +1,54 @@
+"""Benchmark pembuatan wallet untuk Refferals.User (user per detik).
+
+Baris "cara lama" mengulang penurunan key versi awal User (Account.create() lalu dua kali
+privateKeyToAccount) sebagai pembanding.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_wallets [jumlah_user] [workers]
+"""
+import os
+import sys
+import time
+
+from eth_account import Account
+
+# test.py di root repo bernama sama dengan paket stdlib `test`; root repo harus di depan sys.path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from test import Refferals  # noqa: E402
+
+
+class LegacyUser:
+    """Penurunan key seperti User versi awal: tiga kali perkalian kurva eliptik per user."""
+
+    def __init__(self):
+        self.private_key = Account.create().key
+        # privateKeyToAccount sudah dihapus dari eth-account; from_key adalah penggantinya
+        self.public_key = Account.from_key(self.private_key)._key_obj.public_key.to_bytes()
+        self.address = Account.from_key(self.private_key).address
+
+
+def rate(label, count, func):
+    start = time.perf_counter()
+    users = func()
+    for user in users:
+        user.address  # Pastikan address benar-benar diturunkan
+    elapsed = time.perf_counter() - start
+    print(f"{label:>24} {count / elapsed:>12,.0f} user/detik")
+
+
+def main(count, workers):
+    workers = workers or os.cpu_count()
+    rate('cara lama', count, lambda: [LegacyUser() for _ in range(count)])
+    rate('satu per satu', count, lambda: [Refferals.User() for _ in range(count)])
+    rate(f'batch {workers} proses', count, lambda: Refferals.create_users(count, workers=workers))
+    start = time.perf_counter()
+    Refferals.create_users(count, lazy=True)
+    print(f"{'batch lazy (tanpa akses)':>24} {count / (time.perf_counter() - start):>12,.0f} user/detik")
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    main(count, workers)
@@ -0,0 +1,181 @@
+"""Pemeriksaan kesetaraan seluruh engine payout terhadap hitung ulang penuh berbasis dict.
+
+Pada jaringan acak (termasuk referrer yang bergabung setelah referral-nya dan sponsor
+tingkat atas yang belakangan mendapat referrer) dibandingkan: mode inkremental, agregat
+downline, engine NumPy dan paralel, serta snapshot yang disimpan lalu dimuat ulang.
+
+Jalankan dari root repo; keluar dengan status 1 jika ada yang tidak setara:
+    python -m benchmarks.check_equivalence [jumlah_anggota] [jumlah_seed]
+"""
+import random
+import sys
+import tempfile
+
+from mlm_core import LEVEL_RATES, MAX_PAID_REFERRALS, MLMSystem, base_reward
+from snapshot import load_snapshot, save_snapshot
+
+FIELDS = ('Stake', 'Total Reward', 'Base Reward', 'Commission')
+DAYS = 30
+# Toleransi relatif untuk engine yang urutan penjumlahannya berbeda (inkremental, paralel)
+TOLERANCE = 1e-9
+
+
+def build_operations(size, seed):
+    """Operasi add_user/set_staking acak dalam dua fase.
+
+    Fase pertama menambahkan anggota dalam urutan acak sehingga referrer bisa muncul setelah
+    referral-nya, ditambah sponsor yang baru belakangan mendapat referrer dan anggota yang
+    didaftarkan ulang di bawah referrer kedua (setelah agregat dibaca). Fase kedua hanya
+    berisi operasi yang bisa diterapkan sebagai delta oleh mode inkremental.
+    """
+    rng = random.Random(seed)
+    # Seed ganjil memakai id integer (mulai dari 1 karena referrer 0 dianggap tidak ada)
+    ids = list(range(1, 2 * size + 1)) if seed % 2 else [f"u{i}" for i in range(2 * size)]
+    parents = [None] + [rng.randrange(i) if rng.random() > 0.01 else None for i in range(1, size)]
+    order = list(range(size))
+    rng.shuffle(order)
+    first = [('add_user', ids[i], f"User {i}", rng.uniform(100, 10000),
+              ids[parents[i]] if parents[i] is not None else None) for i in order]
+    # Agregat dibaca dulu agar pendaftaran ulang diterapkan pada agregat yang sudah terbangun
+    first.append(('downline_count', ids[0]))
+    rereferred = [ids[i] for i in rng.sample(range(1, size), size // 50)]
+    for user_id in rereferred:
+        # Referrer kedua bisa sama dengan parent (edge ganda) atau user lain
+        first.append(('add_user', user_id, 'Again', rng.uniform(100, 10000), ids[rng.randrange(size)]))
+    for j in range(size // 50):
+        late, child = ids[size + 2 * j], ids[size + 2 * j + 1]
+        first.append(('add_user', late, 'Late', rng.uniform(100, 10000), None))
+        first.append(('add_user', child, 'Late child', rng.uniform(100, 10000), late))
+        first.append(('add_user', rereferred[j], 'Again', rng.uniform(100, 10000), late))
+        first.append(('add_user', late, 'Late', rng.uniform(100, 10000), ids[rng.randrange(size)]))
+    registered = list(dict.fromkeys(operation[1] for operation in first if operation[0] == 'add_user'))
+
+    second = [('set_staking', user_id, rng.uniform(100, 10000)) for user_id in rereferred]
+    for j in range(size // 2):
+        if rng.random() < 0.5:
+            user_id = f"x{seed}_{j}" if isinstance(ids[0], str) else 3 * size + j
+            second.append(('add_user', user_id, 'New', rng.uniform(100, 10000), rng.choice(registered)))
+            registered.append(user_id)
+        else:
+            second.append(('set_staking', rng.choice(registered), rng.uniform(100, 10000)))
+    return first, second
+
+
+def replay(mlm, operations):
+    for name, *args in operations:
+        getattr(mlm, name)(*args)
+    return mlm
+
+
+def full_recompute(mlm, days):
+    """Laporan komisi dari hitung ulang penuh yang hanya membaca users, referrals, dan parents."""
+    rewards = {user_id: base_reward(details['staking'], days) for user_id, details in mlm.users.items()}
+    commission = dict.fromkeys(mlm.users, 0)
+    referrer_fee = dict.fromkeys(mlm.users, 0)
+    for referrer, referrals in mlm.referrals.items():
+        targets = [referrer]
+        while len(targets) < len(LEVEL_RATES) and mlm.parents.get(targets[-1]):
+            targets.append(mlm.parents[targets[-1]])
+        for referral in referrals[:MAX_PAID_REFERRALS]:
+            for target, rate in zip(targets, LEVEL_RATES):
+                amount = rewards[referral] * rate
+                commission[target] += amount
+                referrer_fee[referral] += amount
+    return {user_id: {'Stake': details['staking'],
+                      'Total Reward': rewards[user_id] + commission[user_id] - referrer_fee[user_id],
+                      'Base Reward': rewards[user_id], 'Commission': commission[user_id]}
+            for user_id, details in mlm.users.items()}
+
+
+def brute_force_downline(mlm, user_id):
+    """Jumlah dan total stake downline dengan menelusuri pohon di bawah user_id."""
+    count, stake = 0, 0
+    stack = [user_id]
+    while stack:
+        referrer = stack.pop()
+        for child in mlm.referrals.get(referrer, ()):
+            # Referral ganda ke referrer lain tidak memindahkan user dari pohon referrer pertamanya
+            if mlm.parents.get(child) == referrer:
+                count += 1
+                stake += mlm.users[child]['staking'] if child in mlm.users else 0
+                stack.append(child)
+    return count, stake
+
+
+def max_difference(report, expected, exact=False):
+    """Selisih relatif terbesar antara dua laporan; inf jika daftar user berbeda."""
+    if report.keys() != expected.keys():
+        return float('inf')
+    if exact:
+        return 0.0 if report == expected else float('inf')
+    return max((abs(report[user][field] - row[field]) / max(abs(row[field]), 1.0)
+                for user, row in expected.items() for field in FIELDS), default=0.0)
+
+
+def check_seed(size, seed):
+    """Menjalankan seluruh pemeriksaan untuk satu seed; mengembalikan daftar (nama, selisih, toleransi)."""
+    first, second = build_operations(size, seed)
+    results = []
+
+    reference = replay(MLMSystem(), first + second)
+    expected = full_recompute(reference, DAYS)
+    reference.calculate_rewards(DAYS)
+    results.append(('dict', max_difference(reference.get_commission_report(), expected, exact=True), 0.0))
+
+    incremental = replay(MLMSystem(incremental=True), first)
+    incremental.calculate_rewards(DAYS)
+    replay(incremental, second)
+    # Fase kedua harus diterapkan sebagai delta, bukan ditunda ke hitung ulang penuh
+    ready = incremental._rewards_ready
+    results.append(('inkremental', max_difference(incremental.get_commission_report(), expected)
+                    if ready else float('inf'), TOLERANCE))
+
+    worst = 0.0
+    for user_id in incremental.users:
+        count, stake = brute_force_downline(reference, user_id)
+        if incremental.downline_count(user_id) != count:
+            worst = float('inf')
+        worst = max(worst, abs(incremental.total_stake_under(user_id) - stake) / max(stake, 1.0),
+                    abs(incremental.commission_from_downline(user_id) - expected[user_id]['Commission'])
+                    / max(expected[user_id]['Commission'], 1.0))
+    results.append(('agregat', worst, TOLERANCE))
+
+    vectorized = replay(MLMSystem(vectorized=True), first + second)
+    vectorized.calculate_rewards(DAYS)
+    results.append(('numpy', max_difference(vectorized.get_commission_report(), expected, exact=True), 0.0))
+
+    parallel = replay(MLMSystem(workers=2), first + second)
+    try:
+        parallel.calculate_rewards(DAYS)
+        results.append(('paralel', max_difference(parallel.get_commission_report(), expected), TOLERANCE))
+    finally:
+        parallel.close()
+
+    with tempfile.TemporaryDirectory() as path:
+        save_snapshot(reference, path)
+        snapshot = load_snapshot(path)
+        results.append(('snapshot', max_difference(snapshot.get_commission_report(), expected, exact=True), 0.0))
+        # Sistem hasil muat ulang harus menghitung payout berikutnya sama seperti aslinya
+        reloaded = snapshot.to_system()
+        reloaded.calculate_rewards(DAYS + 1)
+        results.append(('snapshot dimuat ulang', max_difference(
+            reloaded.get_commission_report(), full_recompute(reference, DAYS + 1), exact=True), 0.0))
+    return results
+
+
+def main(size, seeds):
+    failed = 0
+    print(f"{'seed':>4} {'pemeriksaan':>22} {'selisih':>10} {'status':>7}")
+    for seed in range(seeds):
+        for name, difference, tolerance in check_seed(size, seed):
+            ok = difference <= tolerance
+            failed += not ok
+            print(f"{seed:>4} {name:>22} {difference:>10.2e} {'OK' if ok else 'GAGAL':>7}")
+    print(f"{failed} pemeriksaan gagal")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    seeds = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    sys.exit(main(size, seeds))
@@ -0,0 +1,52 @@
+"""Generator jaringan referral sintetis untuk benchmark.
+
+Setiap generator menghasilkan baris (user_id, nama, staking, referrer) yang bisa langsung
+dipakai oleh `add_user` maupun `add_users`.
+"""
+import random
+
+
+def _row(rng, i, referrer):
+    return f"u{i}", f"User {i}", rng.uniform(100, 10000), referrer
+
+
+def chain(size, seed=0):
+    """Rantai dalam: setiap anggota mereferensikan anggota sebelumnya."""
+    rng = random.Random(seed)
+    for i in range(size):
+        yield _row(rng, i, f"u{i - 1}" if i else None)
+
+
+def star(size, seed=0):
+    """Bintang lebar: seluruh anggota direferensikan oleh satu sponsor."""
+    rng = random.Random(seed)
+    for i in range(size):
+        yield _row(rng, i, "u0" if i else None)
+
+
+def random_tree(size, seed=0, root_probability=0.0):
+    """Pohon acak seragam; dengan root_probability > 0 menjadi hutan dengan banyak sponsor tingkat atas."""
+    rng = random.Random(seed)
+    for i in range(size):
+        is_root = i == 0 or (root_probability and rng.random() < root_probability)
+        yield _row(rng, i, None if is_root else f"u{rng.randrange(i)}")
+
+
+def preferential_attachment(size, seed=0):
+    """Preferential attachment: peluang menjadi referrer sebanding dengan (jumlah referral + 1)."""
+    rng = random.Random(seed)
+    candidates = []  # Setiap anggota muncul sekali, ditambah sekali untuk setiap referral-nya
+    for i in range(size):
+        referrer = rng.choice(candidates) if candidates else None
+        yield _row(rng, i, f"u{referrer}" if referrer is not None else None)
+        candidates.append(i)
+        if referrer is not None:
+            candidates.append(referrer)
+
+
+SHAPES = {
+    'chain': chain,
+    'star': star,
+    'random': random_tree,
+    'preferential': preferential_attachment,
+}
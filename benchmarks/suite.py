@@ -0,0 +1,157 @@
+"""Benchmark suite untuk semua varian MLMSystem pada jaringan sintetis.
+
+Setiap pengukuran ditulis sebagai satu baris JSON (variant, shape, size, operation,
+seconds, us_per_member) sehingga hasil antar versi dapat dibandingkan.
+
+Jalankan dari root repo:
+    python -m benchmarks.suite --sizes 1000 10000 100000 1000000 --output hasil.jsonl
+    python -m benchmarks.suite --compare baseline.jsonl hasil.jsonl
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+from benchmarks.generators import SHAPES
+from compact_store import CompactMLMSystem
+from mlm_core import MLMSystem
+
+# Jaringan penuh hanya di-layout sampai ukuran ini (spring layout kuadratik)
+FULL_LAYOUT_LIMIT = 1000
+VARIANT_NAMES = ('dict', 'numpy', 'parallel', 'incremental', 'compact', 'test2')
+
+
+def _variants():
+    # test2.py menampilkan widget saat diimport; outputnya dibuang
+    with contextlib.redirect_stdout(io.StringIO()):
+        import test2
+    return {
+        'dict': MLMSystem,
+        'numpy': lambda: MLMSystem(vectorized=True),
+        'parallel': lambda: MLMSystem(workers=os.cpu_count()),
+        'incremental': lambda: MLMSystem(incremental=True),
+        'compact': CompactMLMSystem,
+        'test2': test2.MLMSystem,
+    }
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _build(mlm, rows):
+    if hasattr(mlm, 'add_users'):
+        mlm.add_users(rows)
+    else:
+        for row in rows:
+            mlm.add_user(*row)
+
+
+def _build_sequential(mlm, rows):
+    """Membangun jaringan dengan add_user satu per satu (jalur yang dipakai UI dan payout_service)."""
+    for row in rows:
+        mlm.add_user(*row)
+
+
+def _add_sample(mlm, rows, count, seed=0):
+    """Menambahkan `count` anggota baru satu per satu ke referrer acak."""
+    rng = random.Random(seed)
+    for j in range(count):
+        mlm.add_user(f"bench{j}", f"Bench {j}", 1000.0, rows[rng.randrange(len(rows))][0])
+
+
+def _layout_full(mlm):
+    import networkx as nx
+
+    graph = nx.DiGraph()
+    graph.add_edges_from((referrer, referral) for referrer, referrals in mlm.referrals.items() for referral in referrals)
+    nx.spring_layout(graph, seed=0)
+
+
+def _layout_view(mlm):
+    from graph_view import ReferralGraphView
+
+    ReferralGraphView(mlm).update()
+
+
+def run(variants, shapes, sizes, add_sample):
+    """Generator record hasil benchmark."""
+    factories = _variants()
+    for shape in shapes:
+        for size in sizes:
+            rows = list(SHAPES[shape](size))
+            for variant in variants:
+                mlm = factories[variant]()
+                operations = [
+                    ('build', lambda: _build(mlm, rows), size),
+                    ('build_sequential', lambda: _build_sequential(factories[variant](), rows), size),
+                    ('calculate_rewards', lambda: mlm.calculate_rewards(30), size),
+                    ('calculate_rewards_repeat', lambda: mlm.calculate_rewards(30), size),
+                    ('get_commission_report', mlm.get_commission_report, size),
+                    ('add_user', lambda: _add_sample(mlm, rows, add_sample), add_sample),
+                ]
+                if hasattr(mlm, 'referrals') and hasattr(mlm, 'parents'):
+                    operations.append(('layout_view', lambda: _layout_view(mlm), size))
+                    if size <= FULL_LAYOUT_LIMIT:
+                        operations.append(('layout_full', lambda: _layout_full(mlm), size))
+                for operation, func, count in operations:
+                    seconds = _timed(func)
+                    yield {
+                        'variant': variant, 'shape': shape, 'size': size, 'operation': operation,
+                        'seconds': seconds, 'us_per_member': seconds / max(count, 1) * 1e6,
+                    }
+
+
+def _load(path):
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return {(r['variant'], r['shape'], r['size'], r['operation']): r['seconds'] for r in records}
+
+
+def compare(baseline_path, current_path, threshold):
+    """Mencetak rasio waktu terhadap baseline; mengembalikan jumlah regresi di atas threshold."""
+    baseline, current = _load(baseline_path), _load(current_path)
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys(), key=str):
+        ratio = current[key] / baseline[key] if baseline[key] else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = '  << REGRESI'
+            regressions += 1
+        print(f"{'/'.join(map(str, key)):<60} {baseline[key]:>10.4f} {current[key]:>10.4f} {ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--variants', nargs='+', default=list(VARIANT_NAMES), choices=VARIANT_NAMES)
+    parser.add_argument('--shapes', nargs='+', default=list(SHAPES), choices=list(SHAPES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000])
+    parser.add_argument('--add-sample', type=int, default=200, help="jumlah add_user tunggal yang diukur")
+    parser.add_argument('--output', help="file JSON lines (default stdout)")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'))
+    parser.add_argument('--threshold', type=float, default=1.5, help="rasio waktu yang dianggap regresi")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 1 if compare(*args.compare, args.threshold) else 0
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for record in run(args.variants, args.shapes, args.sizes, args.add_sample):
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
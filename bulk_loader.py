@@ -0,0 +1,64 @@
+import csv
+import time
+
+from mlm_core import MLMSystem
+
+# Kolom yang diharapkan pada file ekspor anggota
+COLUMNS = ('user_id', 'name', 'staking', 'referrer')
+
+
+def iter_csv_chunks(path, chunk_size=100_000):
+    """Membaca CSV `user_id,name,staking,referrer` secara streaming dalam potongan berisi tuple baris."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        positions = [header.index(column) for column in COLUMNS]
+        chunk = []
+        for record in reader:
+            user_id, name, staking, referrer = (record[p] for p in positions)
+            chunk.append((user_id, name, float(staking), referrer or None))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def iter_parquet_chunks(path, chunk_size=100_000):
+    """Membaca file Parquet per batch (membutuhkan pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow diperlukan untuk membaca file Parquet: pip install pyarrow")
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=list(COLUMNS)):
+        user_ids, names, stakes, referrers = (batch.column(i).to_pylist() for i in range(len(COLUMNS)))
+        yield [(user_id, name, float(staking), referrer or None)
+               for user_id, name, staking, referrer in zip(user_ids, names, stakes, referrers)]
+
+
+def load_network(path, mlm=None, chunk_size=100_000):
+    """Mengimpor jaringan referral dari CSV atau Parquet ke `mlm` (default MLMSystem baru).
+
+    Mengembalikan tuple (mlm, stats) dengan stats berisi jumlah baris, durasi, dan baris per detik.
+    """
+    if mlm is None:
+        mlm = MLMSystem()
+    read_chunks = iter_parquet_chunks if str(path).endswith('.parquet') else iter_csv_chunks
+
+    rows = 0
+    start = time.perf_counter()
+    for chunk in read_chunks(path, chunk_size):
+        mlm.add_users(chunk)
+        rows += len(chunk)
+    seconds = time.perf_counter() - start
+    stats = {'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds else 0.0}
+    return mlm, stats
+
+
+if __name__ == '__main__':
+    import sys
+
+    _, stats = load_network(sys.argv[1])
+    print(f"{stats['rows']} baris dimuat dalam {stats['seconds']:.2f} detik ({stats['rows_per_second']:,.0f} baris/detik)")
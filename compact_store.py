@@ -0,0 +1,100 @@
+from array import array
+
+from mlm_core import ANNUAL_RATE, DAYS_PER_YEAR, LEVEL_RATES, MAX_PAID_REFERRALS
+
+
+class CompactMLMSystem:
+    """Penyimpanan pengguna struct-of-arrays dengan antarmuka yang sama seperti MLMSystem.
+
+    Setiap user id eksternal dipetakan ke indeks integer; kolom numerik disimpan di
+    `array('d')`/`array('q')` sehingga satu anggota hanya memakan beberapa puluh byte.
+    """
+
+    def __init__(self):
+        self.ids = []  # indeks -> user id eksternal
+        self.index = {}  # user id eksternal -> indeks
+        self.names = []  # None untuk referrer yang belum terdaftar sebagai user
+        self.staking = array('d')
+        self.base_reward = array('d')
+        self.commission = array('d')
+        self.total_reward = array('d')
+        self.referrer_fee = array('d')
+        self.parent = array('q')  # indeks referrer, -1 jika tidak ada
+        self.child_count = array('q')
+        self.paid = bytearray()  # 1 jika user termasuk 3 referral pertama dari referrer-nya
+        self.days = 0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _intern(self, user_id):
+        """Mengembalikan indeks integer untuk user id, membuat slot baru bila belum ada."""
+        i = self.index.get(user_id)
+        if i is None:
+            i = len(self.ids)
+            self.index[user_id] = i
+            self.ids.append(user_id)
+            self.names.append(None)
+            for column in (self.staking, self.base_reward, self.commission, self.total_reward, self.referrer_fee):
+                column.append(0.0)
+            self.parent.append(-1)
+            self.child_count.append(0)
+            self.paid.append(0)
+        return i
+
+    def add_user(self, user_id, user_name, staking_amount, referrer=None):
+        """Menambahkan pengguna baru dengan nama, jumlah staking, dan referrer."""
+        i = self._intern(user_id)
+        self.names[i] = user_name
+        self.staking[i] = staking_amount
+        self.base_reward[i] = self.commission[i] = self.total_reward[i] = self.referrer_fee[i] = 0.0
+        if referrer and self.parent[i] < 0:
+            r = self._intern(referrer)
+            self.parent[i] = r
+            self.paid[i] = self.child_count[r] < MAX_PAID_REFERRALS
+            self.child_count[r] += 1
+
+    def add_users(self, rows):
+        """Menambahkan banyak pengguna sekaligus dari iterable (user_id, nama, staking, referrer)."""
+        add_user = self.add_user
+        for user_id, user_name, staking_amount, referrer in rows:
+            add_user(user_id, user_name, staking_amount, referrer)
+
+    def total_staked(self):
+        """Menghitung jumlah total yang di-stake oleh semua pengguna."""
+        return sum(self.staking)
+
+    def calculate_rewards(self, days):
+        """Menghitung reward dan komisi untuk semua pengguna."""
+        self.days = days
+        n = len(self.ids)
+        staking, base_reward, parent = self.staking, self.base_reward, self.parent
+        commission = self.commission = array('d', bytes(8 * n))
+        referrer_fee = self.referrer_fee = array('d', bytes(8 * n))
+        for i in range(n):
+            base_reward[i] = staking[i] * ANNUAL_RATE / DAYS_PER_YEAR * days  # 12% per tahun dari staking
+
+        for i in range(n):
+            if not self.paid[i]:
+                continue
+            referral_reward = base_reward[i]
+            current_referrer = parent[i]
+            for rate in LEVEL_RATES:  # Komisi 5%, lalu royalti 3% dan 2%
+                amount = referral_reward * rate
+                commission[current_referrer] += amount
+                referrer_fee[i] += amount
+                current_referrer = parent[current_referrer]
+                if current_referrer < 0:
+                    break
+
+        self.total_reward = array('d', (base_reward[i] + commission[i] - referrer_fee[i] for i in range(n)))
+
+    def iter_commission_report(self):
+        """Menghasilkan baris laporan komisi (user_id, detail) satu per satu tanpa membangun dict penuh."""
+        for i, user in enumerate(self.ids):
+            if self.names[i] is not None:
+                yield user, {'Stake': self.staking[i], 'Total Reward': self.total_reward[i], 'Base Reward': self.base_reward[i], 'Commission': self.commission[i]}
+
+    def get_commission_report(self):
+        """Mengembalikan laporan komisi untuk setiap pengguna, termasuk stake mereka."""
+        return dict(self.iter_commission_report())
@@ -0,0 +1,120 @@
+from itertools import islice
+
+import matplotlib.pyplot as plt
+import networkx as nx
+
+
+class ReferralGraphView:
+    """Tampilan graf referral untuk jaringan besar.
+
+    Hanya subtree dari `root` sampai `max_depth` level yang digambar; referral di luar
+    `max_children` per node dan subtree di bawah batas kedalaman diringkas menjadi node
+    agregat. Graf, label, dan layout di-cache: label hanya dibuat ulang untuk user yang
+    datanya berubah, dan layout hanya dihitung ulang ketika struktur yang terlihat berubah.
+    """
+
+    def __init__(self, mlm, root=None, max_depth=3, max_children=5):
+        self.mlm = mlm
+        self.root = root
+        self.max_depth = max_depth
+        self.max_children = max_children
+        self.graph = nx.DiGraph()
+        self.pos = {}
+        self.labels = {}
+        self._fingerprints = {}
+
+    def set_view(self, root=None, max_depth=None, max_children=None):
+        """Mengubah root dan batas tampilan; cache dipakai ulang untuk node yang tetap terlihat."""
+        self.root = root
+        if max_depth is not None:
+            self.max_depth = max_depth
+        if max_children is not None:
+            self.max_children = max_children
+
+    def _top_sponsors(self):
+        """Beberapa sponsor tingkat atas pertama (tanpa referrer) dan apakah masih ada sisanya."""
+        parents = self.mlm.parents
+        sponsors = list(islice((user for user in self.mlm.users if user not in parents), self.max_children + 1))
+        return sponsors[:self.max_children], len(sponsors) > self.max_children
+
+    def _visible(self):
+        """BFS terbatas dari root; mengembalikan node (id -> data) dan edge yang akan digambar."""
+        users, referrals = self.mlm.users, self.mlm.referrals
+        nodes, edges = {}, []
+        if self.root is not None:
+            frontier, more_sponsors = [self.root], False
+        else:
+            frontier, more_sponsors = self._top_sponsors()
+        if more_sponsors:
+            nodes[('more', None)] = "Sponsor lainnya"
+
+        for depth in range(self.max_depth + 1):
+            next_frontier = []
+            for user in frontier:
+                details = users.get(user)
+                nodes[user] = details and (details['name'], details['staking'], details['total_reward'], details['commission'])
+                children = referrals.get(user, [])
+                if not children:
+                    continue
+                if depth == self.max_depth:
+                    # Batas kedalaman: seluruh downline diringkas menjadi satu node
+                    aggregate = ('subtree', user)
+                    nodes[aggregate] = f"{len(children)} referral\n(diringkas)"
+                    edges.append((user, aggregate))
+                    continue
+                shown = children[:self.max_children]
+                next_frontier.extend(shown)
+                edges.extend((user, child) for child in shown)
+                if len(children) > len(shown):
+                    aggregate = ('more', user)
+                    nodes[aggregate] = f"+{len(children) - len(shown)} referral lain"
+                    edges.append((user, aggregate))
+            frontier = next_frontier
+        return nodes, edges
+
+    def _label(self, user, data):
+        if data is None:
+            return f"({user})"
+        name, staking, total_reward, commission = data
+        return f"{name} ({user})\nStake: {staking}\nReward: {total_reward:.2f}\nCommission: {commission:.2f}"
+
+    def _layout(self):
+        # Gunakan Graphviz untuk layout pohon; graf yang digambar selalu berukuran terbatas
+        try:
+            self.pos = nx.nx_agraph.graphviz_layout(self.graph, prog='dot')
+        except ImportError:
+            kept = [node for node in self.graph if node in self.pos]
+            initial = {node: self.pos[node] for node in kept} or None
+            self.pos = nx.spring_layout(self.graph, pos=initial, fixed=kept or None, seed=0)
+
+    def update(self):
+        """Menyinkronkan graf yang di-cache dengan jaringan; hanya bagian yang berubah diperbarui."""
+        nodes, edges = self._visible()
+        if set(nodes) != set(self.graph.nodes) or set(edges) != set(self.graph.edges):
+            graph = nx.DiGraph()
+            graph.add_nodes_from(nodes)
+            graph.add_edges_from(edges)
+            self.graph = graph
+            for node in list(self.labels):
+                if node not in nodes:
+                    del self.labels[node]
+                    del self._fingerprints[node]
+            self._layout()
+
+        for node, data in nodes.items():
+            if self._fingerprints.get(node, self) != data:
+                self._fingerprints[node] = data
+                self.labels[node] = data if isinstance(node, tuple) else self._label(node, data)
+        return self.graph
+
+    def draw(self):
+        """Menggambar subtree yang terlihat."""
+        self.update()
+        colors = ['lightgray' if isinstance(node, tuple) else 'skyblue' for node in self.graph]
+        plt.figure(figsize=(12, 8))
+        nx.draw(self.graph, self.pos, labels=self.labels, with_labels=True, node_color=colors, node_size=5000,
+                alpha=0.6, font_size=10, font_weight='bold', edge_color='darkblue', width=2,
+                arrowstyle='-|>', arrowsize=15)
+        plt.title('Referral Network Tree Graph')
+        plt.axis('off')
+        plt.show()
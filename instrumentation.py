@@ -0,0 +1,83 @@
+import contextlib
+import json
+import time
+
+# Dipakai saat instrumentasi nonaktif: satu context manager kosong untuk semua fase
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def null_phase(name):
+    return _NULL_PHASE
+
+
+class PayoutInstrumentation:
+    """Mencatat durasi per fase dan counter untuk setiap payout, lalu mengirim record ke sink.
+
+    Sink adalah callable yang menerima satu dict record, misalnya MemorySink,
+    LoggingSink, atau JsonLinesSink.
+    """
+
+    def __init__(self, *sinks):
+        self.sinks = list(sinks)
+        self._record = None
+
+    def start(self, **info):
+        """Memulai record baru untuk satu payout."""
+        self._record = {'timestamp': time.time(), **info, 'phases': {}, 'counters': {}}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Context manager yang menambahkan durasi blok ke fase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = self._record['phases']
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name, value=1):
+        counters = self._record['counters']
+        counters[name] = counters.get(name, 0) + value
+
+    def finish(self):
+        """Menutup record dan mengirimkannya ke semua sink."""
+        record = self._record
+        record['total_seconds'] = sum(record['phases'].values())
+        self._record = None
+        for sink in self.sinks:
+            sink(record)
+        return record
+
+
+class MemorySink:
+    """Menyimpan semua record di memori (berguna untuk notebook dan pengujian)."""
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+
+class LoggingSink:
+    """Menulis record ke logger standar Python."""
+
+    def __init__(self, logger=None, level=None):
+        import logging  # Dimuat saat dipakai agar import mlm_core tetap ringan
+
+        self.logger = logger or logging.getLogger('mlm.payout')
+        self.level = logging.INFO if level is None else level
+
+    def __call__(self, record):
+        self.logger.log(self.level, "payout %s", json.dumps(record, default=str))
+
+
+class JsonLinesSink:
+    """Menambahkan setiap record sebagai satu baris JSON ke file."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, record):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, default=str) + '\n')
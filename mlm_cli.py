@@ -0,0 +1,68 @@
+"""Menjalankan payout MLMSystem dari command line tanpa Jupyter.
+
+Contoh:
+    python mlm_cli.py anggota.csv --days 30 --engine numpy --output laporan.csv
+    python mlm_cli.py snapshot_dir/ --days 30 --top 100 --format jsonl
+"""
+import argparse
+import os
+import sys
+import time
+
+from mlm_core import MLMSystem
+from report_stream import iter_report, write_csv, write_jsonl
+
+
+def load_system(path, **options):
+    """Memuat jaringan dari CSV/Parquet atau dari direktori snapshot."""
+    if os.path.isdir(path):
+        from snapshot import load_snapshot
+
+        return load_snapshot(path).to_system(**options)
+    from bulk_loader import load_network
+
+    mlm, _ = load_network(path, MLMSystem(**options))
+    return mlm
+
+
+def write_report(mlm, out, fmt='csv', top=None):
+    """Menulis laporan komisi secara streaming; `top` membatasi ke N komisi terbesar."""
+    rows = mlm.iter_commission_report()
+    if top is not None:
+        rows = iter_report(rows, order_by='Commission', limit=top)
+    return (write_jsonl if fmt == 'jsonl' else write_csv)(rows, out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hitung reward dan komisi dari file jaringan referral.")
+    parser.add_argument('input', help="CSV/Parquet user_id,name,staking,referrer atau direktori snapshot")
+    parser.add_argument('--days', type=float, required=True, help="jumlah hari reward")
+    parser.add_argument('--engine', choices=('dict', 'numpy', 'parallel'), default='dict')
+    parser.add_argument('--workers', type=int, help="jumlah proses untuk engine parallel")
+    parser.add_argument('--output', help="file laporan komisi (default stdout)")
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv', help="format laporan")
+    parser.add_argument('--top', type=int, help="hanya N user dengan komisi terbesar")
+    args = parser.parse_args(argv)
+
+    options = {'vectorized': args.engine == 'numpy'}
+    if args.engine == 'parallel':
+        options['workers'] = args.workers or os.cpu_count()
+
+    start = time.perf_counter()
+    mlm = load_system(args.input, **options)
+    loaded = time.perf_counter()
+    mlm.calculate_rewards(args.days)
+    calculated = time.perf_counter()
+
+    if args.output:
+        with open(args.output, 'w', newline='') as out:
+            write_report(mlm, out, args.format, args.top)
+    else:
+        write_report(mlm, sys.stdout, args.format, args.top)
+    print(f"{len(mlm.users)} user, total staked {mlm.total_staked():.2f}; "
+          f"muat {loaded - start:.2f}s, payout {calculated - loaded:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,415 @@
+from instrumentation import null_phase
+
+# Reward staking: 12% per tahun, dihitung per hari
+ANNUAL_RATE = 0.12
+DAYS_PER_YEAR = 365
+# Tarif per level upline: komisi 5% untuk referrer, royalti 3% dan 2% untuk dua level di atasnya
+LEVEL_RATES = (0.05, 0.03, 0.02)
+# Hanya 3 referral pertama dari setiap referrer yang menghasilkan komisi
+MAX_PAID_REFERRALS = 3
+
+
+def base_reward(staking, days):
+    """Reward staking untuk `days` hari; berlaku untuk angka maupun array NumPy."""
+    return staking * ANNUAL_RATE / DAYS_PER_YEAR * days
+
+
+class MLMSystem:
+    def __init__(self, vectorized=False, incremental=False, workers=None, instrumentation=None):
+        # Menyimpan informasi pengguna termasuk staking dan komisi yang diterima
+        self.users = {}
+        # Menyimpan struktur pohon referral
+        self.referrals = {}
+        # Indeks parent (anak -> referrer) agar pencarian upline tidak memindai seluruh pohon
+        self.parents = {}
+        # Tabel upline: user -> tuple maksimal 3 upline (referrer, level 2, level 3)
+        self.uplines = {}
+        # Agregat downline: user -> [jumlah downline, total stake downline, dasar komisi dari downline]
+        self.subtree = {}
+        # Referrer tambahan (selain parent) untuk user yang didaftarkan ulang di bawah referrer lain
+        self._extra_referrers = {}
+        # Delta (user, jumlah, stake) yang belum diteruskan ke seluruh upline; diterapkan saat agregat dibaca
+        self._pending = []
+        # True setelah add_users: tabel upline dan agregat dibangun ulang sekali saat pertama dibutuhkan
+        self._aggregates_dirty = False
+        self.days = 0
+        # Gunakan engine payout NumPy (payout_numpy.py) alih-alih loop dict
+        self.vectorized = vectorized
+        self._columns = None
+        # Jumlah proses untuk payout paralel per subtree (payout_parallel.py); None = satu proses
+        self.workers = workers
+        self._parallel = None  # ParallelPayout untuk _columns saat ini; pool dipakai ulang antar payout
+        # Mode inkremental: add_user dan set_staking langsung menerapkan delta reward
+        self.incremental = incremental
+        self._rewards_ready = False  # True jika reward sudah dihitung untuk self.days
+        # PayoutInstrumentation opsional untuk mencatat durasi fase dan counter payout
+        self.instrumentation = instrumentation
+
+    def add_user(self, user_id, user_name, staking_amount, referrer=None):
+        """Menambahkan pengguna baru dengan nama, jumlah staking, dan referrer."""
+        self._ensure_aggregates()
+        attaching = bool(referrer) and user_id not in self.parents
+        ancestors = None
+        if attaching:
+            # User baru tanpa downline tidak mungkin membentuk siklus; hanya user yang sudah punya downline yang dicek
+            if referrer == user_id:
+                raise ValueError(f"Referral melingkar: {user_id} adalah upline dari {referrer}")
+            if user_id in self.referrals:
+                ancestors = [referrer] + self._ancestors(referrer)
+                if user_id in ancestors:
+                    raise ValueError(f"Referral melingkar: {user_id} adalah upline dari {referrer}")
+        existed = user_id in self.users or user_id in self.referrals
+        old_stake = self.users[user_id]['staking'] if user_id in self.users else 0
+        self.users[user_id] = {
+            'name': user_name,
+            'staking': staking_amount,
+            'base_reward': 0,  # Reward dasar dari staking
+            'commission': 0,  # Komisi dari referral
+            'total_reward': 0,  # Total reward setelah komisi
+            'referrer_fee': 0 # Total jumlah referral fee yang di bagikan
+        }
+        self._columns = None  # Struktur jaringan berubah, kolom NumPy harus dibangun ulang
+        if referrer:
+            if referrer in self.referrals:
+                self.referrals[referrer].append(user_id)
+            else:
+                self.referrals[referrer] = [user_id]
+            self.parents.setdefault(user_id, referrer)
+            if not attaching:
+                # Edge kedua ke user yang sudah punya parent juga dibayar oleh payout
+                self._add_edge(user_id, referrer, old_stake)
+        self.subtree.setdefault(user_id, [0, 0, 0])
+        if attaching:
+            # User (beserta downline yang sudah ada) baru terhubung ke upline
+            self._refresh_uplines(user_id)
+            count, stake, _ = self.subtree[user_id]
+            if ancestors is None:
+                self._pending.append((user_id, 1 + count, staking_amount + stake))
+            else:
+                self._add_to_ancestors(user_id, 1 + count, staking_amount + stake, ancestors)
+            if ancestors is not None and self._extra_referrers:
+                # Upline edge tambahan di bawah user_id ikut berubah; lebih sederhana dibangun ulang
+                self._aggregates_dirty = True
+        else:
+            self._apply_stake_delta(user_id, staking_amount - old_stake)
+        if self.incremental and self._rewards_ready:
+            self._add_user_incremental(user_id, referrer, existed)
+
+    def add_users(self, rows):
+        """Menambahkan banyak pengguna sekaligus dari iterable (user_id, nama, staking, referrer).
+
+        Referrer boleh muncul setelah referral-nya. Reward perlu dihitung ulang penuh sesudahnya;
+        tabel upline dan agregat dibangun ulang sekali saat pertama dibutuhkan.
+        """
+        users, referrals, parents = self.users, self.referrals, self.parents
+        for user_id, user_name, staking_amount, referrer in rows:
+            users[user_id] = {'name': user_name, 'staking': staking_amount, 'base_reward': 0,
+                              'commission': 0, 'total_reward': 0, 'referrer_fee': 0}
+            if referrer:
+                children = referrals.get(referrer)
+                if children is None:
+                    referrals[referrer] = [user_id]
+                else:
+                    children.append(user_id)
+                parents.setdefault(user_id, referrer)
+        self._columns = None
+        self._rewards_ready = False
+        self._aggregates_dirty = True
+
+    def _ensure_aggregates(self):
+        """Membangun ulang tabel upline dan agregat jika ditandai kotor oleh add_users."""
+        if self._aggregates_dirty:
+            self._rebuild_aggregates()
+
+    def _flush_pending(self):
+        """Meneruskan delta jumlah/stake yang tertunda ke seluruh upline."""
+        self._ensure_aggregates()
+        pending, self._pending = self._pending, []
+        if len(pending) * 4 >= len(self.users):
+            # Banyak delta tertunda: satu rebuild O(N) lebih murah daripada menelusuri upline satu per satu
+            self._rebuild_aggregates()
+            return
+        for user_id, count, stake in pending:
+            self._add_to_ancestors(user_id, count, stake)
+
+    def _ancestors(self, user_id):
+        """Seluruh upline dari user_id sampai root."""
+        ancestors = []
+        current = self.parents.get(user_id)
+        while current:
+            ancestors.append(current)
+            current = self.parents.get(current)
+        return ancestors
+
+    def _paid_count(self, referral, referrer):
+        """Berapa kali referral muncul di 3 referral pertama referrer (setiap kemunculan dibayar)."""
+        return self.referrals[referrer][:MAX_PAID_REFERRALS].count(referral) if referrer else 0
+
+    def _paid_edges(self, referral):
+        """Rantai upline (referrer, level 2, level 3) untuk setiap edge referral yang menghasilkan komisi."""
+        referrer = self.parents.get(referral)
+        if not referrer:
+            return
+        for referrer in (referrer, *self._extra_referrers.get(referral, ())):
+            targets = (referrer,) + self.uplines.get(referrer, ())[:2]
+            for _ in range(self._paid_count(referral, referrer)):
+                yield targets
+
+    def _add_edge(self, user_id, referrer, stake):
+        """Mencatat edge baru referrer -> user_id yang sudah punya parent beserta dasar komisinya."""
+        if referrer != self.parents[user_id]:
+            extra = self._extra_referrers.setdefault(user_id, [])
+            if referrer not in extra:
+                extra.append(referrer)
+        if len(self.referrals[referrer]) <= MAX_PAID_REFERRALS:
+            for upline, rate in zip((referrer,) + self.uplines.get(referrer, ())[:2], LEVEL_RATES):
+                self.subtree.setdefault(upline, [0, 0, 0])[2] += stake * rate
+
+    def _stake(self, user_id):
+        details = self.users.get(user_id)
+        return details['staking'] if details else 0
+
+    def _add_to_ancestors(self, user_id, count, stake, ancestors=None):
+        """Menambahkan jumlah downline dan stake ke seluruh upline dalam O(kedalaman)."""
+        for ancestor in self._ancestors(user_id) if ancestors is None else ancestors:
+            aggregate = self.subtree.setdefault(ancestor, [0, 0, 0])
+            aggregate[0] += count
+            aggregate[1] += stake
+
+    def _apply_stake_delta(self, user_id, delta):
+        """Memperbarui agregat upline setelah stake user berubah sebesar delta."""
+        if not delta or user_id not in self.parents:
+            return
+        self._pending.append((user_id, 0, delta))
+        for targets in self._paid_edges(user_id):
+            for upline, rate in zip(targets, LEVEL_RATES):
+                self.subtree[upline][2] += delta * rate
+
+    def _refresh_uplines(self, user_id):
+        """Memperbarui tabel upline user_id serta anak dan cucunya setelah user_id mendapat referrer."""
+        level = [user_id]
+        for _ in range(3):
+            next_level = []
+            for user in level:
+                referrer = self.parents.get(user)
+                old = self.uplines.get(user, ())
+                new = (referrer,) + self.uplines.get(referrer, ())[:2] if referrer else ()
+                self.uplines[user] = new
+                if len(new) > len(old):
+                    stake = self._stake(user) * self._paid_count(user, referrer)
+                    for upline, rate in zip(new[len(old):], LEVEL_RATES[len(old):]):
+                        self.subtree.setdefault(upline, [0, 0, 0])[2] += stake * rate
+                next_level.extend(child for child in self.referrals.get(user, ()) if self.parents.get(child) == user)
+            level = next_level
+
+    def _rebuild_aggregates(self):
+        """Membangun ulang tabel upline dan agregat downline dari awal dalam O(N)."""
+        users, parents, referrals = self.users, self.parents, self.referrals
+        self._pending = []
+        self._aggregates_dirty = False
+        self._extra_referrers = extra_referrers = {}
+        self.uplines = uplines = {}
+        nodes = dict.fromkeys([*users, *referrals])
+        self.subtree = subtree = {user_id: [0, 0, 0] for user_id in nodes}
+        stakes = {user_id: details['staking'] for user_id, details in users.items()}
+        # Telusuri pohon dari root (top-down) agar upline referrer selalu sudah tersedia
+        order = [user_id for user_id in nodes if user_id not in parents]
+        for user_id in order:
+            uplines[user_id] = ()
+        for referrer in order:
+            children = referrals.get(referrer)
+            if children:
+                # Semua anak berbagi tuple upline yang sama
+                chain = (referrer,) + uplines[referrer][:2]
+                for referral in children:
+                    if parents.get(referral) == referrer and referral not in uplines:
+                        uplines[referral] = chain
+                        order.append(referral)
+        # Akumulasi bottom-up untuk jumlah dan stake downline
+        for user_id in reversed(order):
+            referrer = parents.get(user_id)
+            if referrer:
+                aggregate = subtree[referrer]
+                own = subtree[user_id]
+                aggregate[0] += 1 + own[0]
+                aggregate[1] += stakes.get(user_id, 0) + own[1]
+        for referrer, referrals_list in referrals.items():
+            targets = (referrer,) + uplines.get(referrer, ())[:2]
+            for referral in referrals_list:
+                if parents.get(referral) != referrer:
+                    extra = extra_referrers.setdefault(referral, [])
+                    if referrer not in extra:
+                        extra.append(referrer)
+            for referral in referrals_list[:MAX_PAID_REFERRALS]:
+                stake = stakes.get(referral, 0)
+                for upline, rate in zip(targets, LEVEL_RATES):
+                    subtree[upline][2] += stake * rate
+
+    def downline_count(self, user_id):
+        """Jumlah seluruh downline di bawah user_id, O(1) setelah delta tertunda diterapkan."""
+        self._flush_pending()
+        return self.subtree.get(user_id, (0, 0, 0))[0]
+
+    def total_stake_under(self, user_id):
+        """Total stake seluruh downline di bawah user_id, O(1) setelah delta tertunda diterapkan."""
+        self._flush_pending()
+        return self.subtree.get(user_id, (0, 0, 0))[1]
+
+    def commission_from_downline(self, user_id, days=None):
+        """Komisi dan royalti yang diterima user_id dari downline-nya untuk `days` hari (default self.days), O(1)."""
+        days = self.days if days is None else days
+        self._ensure_aggregates()
+        return base_reward(self.subtree.get(user_id, (0, 0, 0))[2], days)
+
+    def set_staking(self, user_id, staking_amount):
+        """Mengubah jumlah staking pengguna; pada mode inkremental reward langsung diperbarui."""
+        details = self.users[user_id]
+        self._ensure_aggregates()
+        self._apply_stake_delta(user_id, staking_amount - details['staking'])
+        details['staking'] = staking_amount
+        if self.incremental and self._rewards_ready:
+            old_base = details['base_reward']
+            details['base_reward'] = base_reward(staking_amount, self.days)
+            self._apply_referral_delta(user_id, details['base_reward'] - old_base)
+
+    def _add_user_incremental(self, user_id, referrer, existed):
+        """Menerapkan delta reward dari pengguna baru dalam O(kedalaman)."""
+        if existed or (referrer and referrer not in self.users):
+            # Pengguna lama ditimpa atau referrer belum terdaftar: hitung ulang penuh pada calculate_rewards berikutnya
+            self._rewards_ready = False
+            return
+        details = self.users[user_id]
+        details['base_reward'] = base_reward(details['staking'], self.days)
+        self._apply_referral_delta(user_id, details['base_reward'])
+
+    def _apply_referral_delta(self, referral, delta):
+        """Menambahkan perubahan base reward `referral` ke komisi dan royalti maksimal 3 level upline."""
+        touched = [referral]
+        # Sama seperti calculate_rewards: hanya 3 referral pertama dari setiap referrer yang dibayar
+        for targets in self._paid_edges(referral):
+            for upline, rate in zip(targets, LEVEL_RATES):  # Komisi 5%, lalu royalti 3% dan 2%
+                amount = delta * rate
+                self.users[upline]['commission'] += amount
+                self.users[referral]['referrer_fee'] += amount
+                touched.append(upline)
+        for user_id in touched:
+            details = self.users[user_id]
+            details['total_reward'] = details['base_reward'] + details['commission'] - details['referrer_fee']
+
+    def total_staked(self):
+        """Menghitung jumlah total yang di-stake oleh semua pengguna."""
+        total = sum(user['staking'] for user in self.users.values())
+        return total
+
+    def calculate_rewards(self, days):
+        """Menghitung reward dan komisi untuk semua pengguna."""
+        if self.incremental and self._rewards_ready and days == self.days:
+            return  # Total berjalan sudah mutakhir, tidak perlu hitung ulang
+        instrumentation = self.instrumentation
+        phase = instrumentation.phase if instrumentation else null_phase
+        if instrumentation:
+            instrumentation.start(engine='parallel' if self.workers else 'numpy' if self.vectorized else 'dict',
+                                  users=len(self.users), days=days)
+        if self.vectorized or self.workers:
+            self._calculate_rewards_vectorized(days, phase)
+        else:
+            self._calculate_rewards_dict(days, phase)
+        if instrumentation:
+            instrumentation.count('edges_visited', self._paid_edge_count())
+            instrumentation.count('upline_hops', self._royalty_hop_count())
+            instrumentation.finish()
+
+    def _calculate_rewards_dict(self, days, phase):
+        """Payout dengan loop dict per pengguna."""
+        self._ensure_aggregates()  # Loop royalti membaca tabel upline
+        # Menghitung reward staking
+        self.days = days
+        with phase('base_reward'):
+            for user, details in self.users.items():
+                details['base_reward'] = base_reward(details['staking'], days)  # 12% per tahun dari staking
+
+            # Reset komisi dan total reward setiap kali fungsi ini dipanggil
+            for user in self.users.values():
+                user['commission'] = 0
+                user['total_reward'] = 0
+                user['referrer_fee'] = 0
+
+        # Menghitung komisi referral beserta royalti per edge; urutan penjumlahan dipertahankan
+        # (5%, 3%, 2% per referral) sehingga hasil identik dengan versi sebelumnya. Durasi royalti
+        # termasuk dalam fase 'commission'; jumlah hop-nya tercatat di counter upline_hops.
+        with phase('commission'):
+            for referrer, referrals in self.referrals.items():
+                uplines = self.uplines.get(referrer, ())[:2]  # Diambil dari tabel upline
+                for referral in referrals[:MAX_PAID_REFERRALS]:  # Hanya sampai 3 level referral
+                    referral_reward = self.users[referral]['base_reward']
+                    # Mengurangi komisi dari reward staking pengguna yang direferensikan
+                    commission = referral_reward * LEVEL_RATES[0]  # 5% komisi
+                    self.users[referrer]['commission'] += commission  # Menambahkan ke pengguna yang mereferensikan
+                    self.users[referral]['referrer_fee'] += commission  # Mengunrangkan Komisi dari reward staking pengguna yang direferensikan
+                    # Komisi royalti untuk yang mereferensikan di atasnya (sampai 2 level di atas)
+                    for parent_referrer, rate in zip(uplines, LEVEL_RATES[1:]):
+                        royalty = referral_reward * rate  # 3% atau 2% royalti
+                        self.users[parent_referrer]['commission'] += royalty
+                        self.users[referral]['referrer_fee'] += royalty  # Mengunrangkan Royalti dari reward staking pengguna yang direferensikan
+
+        # Menambahkan reward dasar dan komisi untuk mendapatkan total reward
+        with phase('totals'):
+            for user, details in self.users.items():
+                details['total_reward'] = details['base_reward'] + details['commission'] - details['referrer_fee']
+        self._rewards_ready = True
+
+    def _paid_edge_count(self):
+        """Jumlah edge referral yang menghasilkan komisi (dihitung hanya saat instrumentasi aktif)."""
+        return sum(min(len(referrals), MAX_PAID_REFERRALS) for referrals in self.referrals.values())
+
+    def _royalty_hop_count(self):
+        """Jumlah hop upline untuk royalti (dihitung hanya saat instrumentasi aktif)."""
+        self._ensure_aggregates()
+        return sum(min(len(referrals), MAX_PAID_REFERRALS) * len(self.uplines.get(referrer, ())[:2])
+                   for referrer, referrals in self.referrals.items())
+
+    def _calculate_rewards_vectorized(self, days, phase=null_phase):
+        """Versi tervektorisasi (atau paralel) dari calculate_rewards; hasil ditulis kembali ke dict pengguna."""
+        from payout_numpy import PayoutColumns, calculate_rewards_vectorized
+        from payout_parallel import ParallelPayout
+
+        self.days = days
+        with phase('columns'):
+            if self._columns is None:
+                self._columns = PayoutColumns.from_system(self)
+            if self.workers and (self._parallel is None or self._parallel.columns is not self._columns):
+                # Jaringan berubah: pool dan shared memory lama dilepas, topologi baru disalin sekali
+                self.close()
+                self._parallel = ParallelPayout(self._columns, self.workers)
+            stakes = [details['staking'] for details in self.users.values()]
+        with phase('payout'):
+            if self.workers:
+                columns = self._parallel.run(stakes, days)
+            else:
+                columns = calculate_rewards_vectorized(self._columns, stakes, days)
+        with phase('totals'):
+            fields = ('base_reward', 'commission', 'referrer_fee', 'total_reward')
+            for details, *values in zip(self.users.values(), *(column.tolist() for column in columns)):
+                details.update(zip(fields, values))
+        self._rewards_ready = True
+
+    def close(self):
+        """Melepas pool proses dan shared memory payout paralel, jika ada."""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
+
+    def simulate(self, events, days):
+        """Proyeksi reward harian dari jaringan saat ini; lihat simulation.RewardSimulation."""
+        from simulation import RewardSimulation
+
+        return RewardSimulation(self).run(events, days)
+
+    def iter_commission_report(self):
+        """Menghasilkan baris laporan komisi (user_id, detail) satu per satu tanpa membangun dict penuh."""
+        for user, details in self.users.items():
+            yield user, {'Stake': details['staking'], 'Total Reward': details['total_reward'], 'Base Reward': details['base_reward'], 'Commission': details['commission']}
+
+    def get_commission_report(self):
+        """Mengembalikan laporan komisi untuk setiap pengguna, termasuk stake mereka."""
+        return dict(self.iter_commission_report())
@@ -0,0 +1,141 @@
+import networkx as nx
+import matplotlib.pyplot as plt
+
+import ipywidgets as widgets
+from IPython.display import display, clear_output
+
+from graph_view import ReferralGraphView
+from mlm_core import MLMSystem
+from report_stream import page
+
+
+class MLMSystemInteractive(MLMSystem):
+    # Di atas jumlah user ini draw_graph hanya menggambar subtree terbatas yang di-cache
+    FULL_GRAPH_LIMIT = 200
+    # Laporan di widget ditampilkan per halaman, diurutkan dari komisi terbesar
+    REPORT_PAGE_SIZE = 20
+
+    def __init__(self):
+        # Mode inkremental: menambah satu user tidak memicu hitung ulang seluruh jaringan
+        super().__init__(incremental=True)
+        self.output_area = widgets.Output()
+        self.graph_area = widgets.Output()
+        self.graph_view = ReferralGraphView(self)
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Membuat widget untuk input dan aksi."""
+        self.user_id_input = widgets.Text(description="User ID:")
+        self.user_name_input = widgets.Text(description="Nama User:")  # Widget input nama pengguna
+        self.staking_input = widgets.FloatText(description="Jumlah Staking:")
+        self.referrer_input = widgets.Text(description="ID Referrer:", placeholder="Opsional")
+        self.add_user_button = widgets.Button(description="Tambah User")
+        self.days_spent = widgets.FloatText(description="Hari Berlalu:")
+        self.calculate_rewards_button = widgets.Button(description="Hitung Reward")
+        self.graph_root_input = widgets.Text(description="Root Graf:", placeholder="Opsional")
+        self.graph_depth_input = widgets.IntText(value=3, description="Kedalaman:")
+        self.report_page_input = widgets.BoundedIntText(value=1, min=1, max=1, description="Halaman:")
+        self.add_user_button.on_click(self.add_user_action)
+        self.calculate_rewards_button.on_click(self.calculate_rewards_action)
+        self.report_page_input.observe(self.report_page_action, names='value')
+        
+        display(widgets.VBox([self.user_id_input, self.user_name_input, self.staking_input, self.referrer_input,
+                              self.add_user_button, self.days_spent, self.calculate_rewards_button,
+                              self.report_page_input,
+                              self.graph_root_input, self.graph_depth_input,
+                              self.output_area, self.graph_area]))
+
+    def draw_graph(self):
+        """Draw a referral network graph using a tree layout."""
+        root = self.graph_root_input.value or None
+        if root is not None or len(self.users) > self.FULL_GRAPH_LIMIT:
+            return self.draw_graph_scalable(root)
+        with self.graph_area:
+            clear_output(wait=True)
+            G = nx.DiGraph()
+
+            # Building the graph nodes and edges from the referral data
+            for referrer, referrals in self.referrals.items():
+                for referral in referrals:
+                    referrer_data = self.users[referrer]
+                    referrer_label = f"{referrer_data['name']} ({referrer})\nStake: {referrer_data['staking']}\nReward: {referrer_data['total_reward']:.2f}\nCommission: {referrer_data['commission']:.2f}"
+                    
+                    referral_data = self.users[referral]
+                    referral_label = f"{referral_data['name']} ({referral})\nStake: {referral_data['staking']}\nReward: {referral_data['total_reward']:.2f}\nCommission: {referral_data['commission']:.2f}"
+                    
+                    G.add_node(referrer_label)  # Add referrer node
+                    G.add_node(referral_label)  # Add referral node
+                    G.add_edge(referrer_label, referral_label)  # Add edge between referrer and referral
+
+            # Use Graphviz to create a tree layout
+            try:
+                pos = nx.nx_agraph.graphviz_layout(G, prog='dot')
+            except ImportError:
+                print("PyGraphviz is not installed. Falling back to planar layout.")
+                pos = nx.planar_layout(G)
+
+            plt.figure(figsize=(12, 8))
+            nx.draw(G, pos, with_labels=True, node_color='skyblue', node_size=5000, alpha=0.6,
+                    font_size=12, font_weight='bold', edge_color='darkblue', width=2, arrowstyle='-|>', arrowsize=15)
+            plt.title('Referral Network Tree Graph')
+            plt.axis('off')  # Hide the axes
+            plt.show()
+
+    def draw_graph_scalable(self, root=None):
+        """Menggambar subtree terbatas dari root dengan graf dan layout yang di-cache."""
+        self.graph_view.set_view(root, max_depth=max(self.graph_depth_input.value, 0))
+        with self.graph_area:
+            clear_output(wait=True)
+            self.graph_view.draw()
+
+
+
+
+    def add_user_action(self, b):
+        """Aksi menambahkan pengguna dengan nama."""
+        user_id = self.user_id_input.value
+        user_name = self.user_name_input.value
+        staking = self.staking_input.value
+        referrer = self.referrer_input.value or None
+        if user_id and user_name and staking > 0:
+            self.add_user(user_id, user_name, staking, referrer)
+            with self.output_area:
+                clear_output(wait=True)
+                print(f"User ditambahkan: {user_name} ({user_id}) dengan staking {staking} dan referrer {referrer}")
+            self.draw_graph()
+        else:
+            with self.output_area:
+                clear_output(wait=True)
+                print("Mohon masukkan detail pengguna yang valid.")
+
+    def calculate_rewards_action(self, b):
+        """Aksi untuk menghitung dan menampilkan reward, komisi, dan stake pengguna serta total staked."""
+        days_spent = self.days_spent.value
+        if days_spent > 0:
+            self.calculate_rewards(days_spent)
+            self.show_report()
+            self.draw_graph()
+        else:
+            with self.output_area:
+                clear_output(wait=True)
+                print("Masukkan jumlah hari yang valid.")
+
+    def report_page_action(self, change):
+        """Aksi saat nomor halaman laporan diubah; tidak menghitung ulang reward."""
+        if self.days:
+            self.show_report()
+
+    def show_report(self):
+        """Menampilkan satu halaman laporan komisi (komisi terbesar lebih dulu) di output."""
+        pages = max(1, -(-len(self.users) // self.REPORT_PAGE_SIZE))
+        self.report_page_input.max = pages
+        number = min(self.report_page_input.value, pages)
+        rows = page(self.iter_commission_report(), number, self.REPORT_PAGE_SIZE, order_by='Commission')
+        total_staked = self.total_staked()
+        with self.output_area:
+            clear_output(wait=True)
+            print(f"Laporan Komisi setelah {self.days} hari:")
+            print(f"Total Staked Keseluruhan: ${total_staked:.2f}\n")
+            for user, details in rows:
+                print(f"{user}: Stake: {details['Stake']:.2f} DNY, Total Reward: {details['Total Reward']:.2f} DNY, Komisi: {details['Commission']:.2f} DNY, Base Reward: {details['Base Reward']:.2f} DNY")
+            print(f"\nHalaman {number} dari {pages} ({len(self.users)} user)")
@@ -0,0 +1,171 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from mlm_core import LEVEL_RATES, base_reward
+from payout_numpy import calculate_rewards_vectorized
+
+# Array shared memory yang ditempelkan sekali per proses worker (lihat _init_worker)
+_worker_arrays = None
+_worker_blocks = []
+
+
+def _share(array, blocks):
+    """Menyalin array ke shared memory dan mengembalikan deskriptor yang bisa dikirim ke worker."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    blocks.append(block)
+    return block.name, array.shape, array.dtype.str
+
+
+def _attach(spec, blocks):
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    blocks.append(block)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _init_worker(specs):
+    """Initializer proses worker: menempelkan seluruh blok shared memory satu kali."""
+    global _worker_arrays
+    _worker_arrays = [_attach(spec, _worker_blocks) for spec in specs]
+
+
+def _release(executor, blocks):
+    """Mematikan pool lalu melepas dan menghapus blok shared memory."""
+    executor.shutdown()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _owned_sums(targets, amounts):
+    unique, inverse = np.unique(targets, return_inverse=True)
+    return unique, np.bincount(inverse, weights=amounts, minlength=len(unique))
+
+
+def _payout_partition(arrays, lo, hi, user_lo, user_hi, days, split_depth):
+    """Menghitung base reward user [user_lo, user_hi) serta komisi dan referrer fee untuk edge [lo, hi).
+
+    Hasil untuk user milik partisi ini ditulis langsung ke shared memory; komisi untuk
+    user boundary (lebih dangkal dari `split_depth`) dikembalikan untuk digabung di proses utama.
+    """
+    parent, depth, edge_src, edge_dst, stakes, rewards, commission, referrer_fee = arrays
+    sentinel = len(parent) - 1
+    rewards[user_lo:user_hi] = base_reward(stakes[user_lo:user_hi], days)
+    src = edge_src[lo:hi]
+    dst = edge_dst[lo:hi]
+
+    targets = np.empty((len(src), len(LEVEL_RATES)), dtype=np.int64)
+    targets[:, 0] = src
+    for level in range(1, len(LEVEL_RATES)):
+        targets[:, level] = parent[targets[:, level - 1]]
+    # Base reward referral dihitung ulang dari stake agar tidak menunggu worker lain
+    amounts = base_reward(stakes[dst], days)[:, None] * np.asarray(LEVEL_RATES)
+    payers = np.repeat(dst, len(LEVEL_RATES))
+    targets, amounts = targets.ravel(), amounts.ravel()
+    valid = targets != sentinel
+    targets, amounts, payers = targets[valid], amounts[valid], payers[valid]
+
+    unique, sums = _owned_sums(payers, amounts)
+    referrer_fee[unique] += sums
+    owned = depth[targets] >= split_depth
+    unique, sums = _owned_sums(targets[owned], amounts[owned])
+    commission[unique] += sums
+    return _owned_sums(targets[~owned], amounts[~owned])
+
+
+def _payout_worker(lo, hi, user_lo, user_hi, days, split_depth):
+    """Entry point tugas di proses worker."""
+    return _payout_partition(_worker_arrays, lo, hi, user_lo, user_hi, days, split_depth)
+
+
+def _partition(keys, parts):
+    """Membagi edge yang sudah diurutkan per key menjadi rentang yang tidak memotong satu key."""
+    if len(keys) == 0:
+        return []
+    bounds = {0, len(keys)}
+    for i in range(1, parts):
+        position = len(keys) * i // parts
+        bounds.add(int(np.searchsorted(keys, keys[position], side='left')))
+    bounds = sorted(bounds)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+
+class ParallelPayout:
+    """Payout paralel per subtree dengan pool proses dan shared memory yang dipakai ulang antar payout.
+
+    Edge dikelompokkan berdasarkan upline pada kedalaman `split_depth`, sehingga setiap
+    worker memegang subtree yang saling lepas. Topologi disalin ke shared memory sekali
+    saat dibuat; setiap `run` hanya menyalin stake. Berlaku untuk satu PayoutColumns:
+    buat instance baru (dan `close` yang lama) setelah jaringan berubah.
+    """
+
+    def __init__(self, columns, workers=None, split_depth=1):
+        self.columns = columns
+        self.workers = workers or os.cpu_count() or 1
+        self.split_depth = split_depth
+        self._blocks = []
+        self._executor = None
+        # Satu user sebagai referral dari beberapa referrer membuat partisi tidak lagi saling lepas
+        if (self.workers < 2 or len(columns.edge_src) == 0
+                or len(np.unique(columns.edge_dst)) != len(columns.edge_dst)):
+            return
+        n = len(columns.ids)
+        order, keys = columns.partition_order(split_depth)
+        edges = _partition(keys, self.workers * 4)
+        users = np.linspace(0, n, len(edges) + 1, dtype=np.int64).tolist()
+        self._tasks = [(lo, hi, user_lo, user_hi) for (lo, hi), user_lo, user_hi in zip(edges, users, users[1:])]
+        specs = [_share(array, self._blocks) for array in (
+            columns.parent, columns.depths(), columns.edge_src[order], columns.edge_dst[order])]
+        # stakes, base reward, komisi, dan referrer fee ditimpa pada setiap payout
+        specs += [_share(np.zeros(n), self._blocks) for _ in range(4)]
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(specs,))
+        self._finalizer = weakref.finalize(self, _release, self._executor, self._blocks)
+
+    def run(self, stakes, days):
+        """Menghitung payout; mengembalikan tuple array yang sama dengan `calculate_rewards_vectorized`.
+
+        Hasil dapat berbeda dari versi satu proses sebatas pembulatan floating point.
+        """
+        if self._executor is None:
+            return calculate_rewards_vectorized(self.columns, stakes, days)
+        n = len(self.columns.ids)
+        shared_stakes, rewards, commission, referrer_fee = (
+            np.ndarray((n,), dtype=np.float64, buffer=block.buf) for block in self._blocks[-4:])
+        shared_stakes[:] = stakes
+        commission[:] = 0
+        referrer_fee[:] = 0
+        futures = [self._executor.submit(_payout_worker, lo, hi, user_lo, user_hi, days, self.split_depth)
+                   for lo, hi, user_lo, user_hi in self._tasks]
+        boundaries = [future.result() for future in futures]
+        # Salin hasil agar view ke shared memory tidak tertahan setelah run selesai
+        rewards, commission, referrer_fee = rewards.copy(), commission.copy(), referrer_fee.copy()
+        del shared_stakes
+
+        # Gabungkan komisi untuk user boundary di dekat root subtree
+        for unique, sums in boundaries:
+            np.add.at(commission, unique, sums)
+        total_reward = rewards + commission - referrer_fee
+        return rewards, commission, referrer_fee, total_reward
+
+    def close(self):
+        """Mematikan pool proses dan menghapus shared memory."""
+        if self._executor is not None:
+            self._finalizer()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def calculate_rewards_parallel(columns, stakes, days, workers=None, split_depth=1):
+    """Payout paralel sekali jalan; untuk payout berulang gunakan ParallelPayout agar pool dipakai ulang."""
+    with ParallelPayout(columns, workers, split_depth) as engine:
+        return engine.run(stakes, days)
@@ -0,0 +1,321 @@
+"""Layanan payout berbasis asyncio di atas MLMSystem.
+
+Penulisan (join, perubahan stake, payout) diantrekan ke satu writer task dan di-commit
+per batch; pembacaan dilayani dari snapshot laporan yang tidak pernah diubah setelah
+dipublikasikan, sehingga query tidak pernah menunggu calculate_rewards yang sedang berjalan.
+
+Menjalankan server HTTP:
+    python payout_service.py --port 8080 [--input anggota.csv]
+"""
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from mlm_core import MLMSystem
+from report_stream import iter_report
+
+
+class Snapshot:
+    """Laporan komisi yang konsisten pada satu versi; tidak pernah dimutasi setelah dipublikasikan.
+
+    Laporan terdiri dari `base` penuh dan `overlay` kecil berisi baris yang berubah sejak
+    base dibuat, sehingga satu batch tulis hanya menyalin overlay, bukan seluruh laporan.
+    """
+
+    def __init__(self, version, base, total_staked, days, overlay=None, size=None):
+        self.version = version
+        self.base = base
+        self.overlay = overlay if overlay is not None else {}
+        self.total_staked = total_staked
+        self.days = days
+        self.size = len(base) if size is None else size
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, user_id):
+        return user_id in self.overlay or user_id in self.base
+
+    def __getitem__(self, user_id):
+        row = self.overlay.get(user_id)
+        return row if row is not None else self.base[user_id]
+
+    def items(self):
+        """Seluruh baris (user_id, detail) dengan urutan base, lalu user baru dari overlay."""
+        base, overlay = self.base, self.overlay
+        for user_id, row in base.items():
+            yield user_id, overlay.get(user_id, row)
+        for user_id, row in overlay.items():
+            if user_id not in base:
+                yield user_id, row
+
+    def updated(self, version, rows, total_staked, days):
+        """Snapshot versi baru dengan `rows` ditambahkan ke overlay; O(ukuran overlay)."""
+        size = self.size + sum(1 for user_id in rows if user_id not in self)
+        overlay = dict(self.overlay)
+        overlay.update(rows)
+        return Snapshot(version, self.base, total_staked, days, overlay, size)
+
+    def merged(self):
+        """Base baru hasil penggabungan overlay; O(N), dijalankan di luar event loop."""
+        return {**self.base, **self.overlay}
+
+
+class PayoutService:
+    """Single-writer queue di depan MLMSystem dengan pembacaan dari snapshot."""
+
+    def __init__(self, mlm=None, max_batch=1000, overlay_limit=4096):
+        self.mlm = mlm if mlm is not None else MLMSystem(incremental=True)
+        self.max_batch = max_batch
+        # Di atas jumlah baris ini overlay digabung ke base baru (di thread lain)
+        self.overlay_limit = overlay_limit
+        self.snapshot = self._full_snapshot(0)
+        self._total_staked = self.snapshot.total_staked  # Total berjalan, tidak dijumlah ulang per batch
+        self._queue = asyncio.Queue()
+        self._writer = None
+
+    def _row(self, details):
+        return {'Stake': details['staking'], 'Total Reward': details['total_reward'],
+                'Base Reward': details['base_reward'], 'Commission': details['commission']}
+
+    def _full_snapshot(self, version):
+        return Snapshot(version, self.mlm.get_commission_report(), self.mlm.total_staked(), self.mlm.days)
+
+    def start(self):
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+
+    async def stop(self):
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+
+    async def _submit(self, operation, *args):
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, args, future))
+        return await future
+
+    async def add_user(self, user_id, user_name, staking_amount, referrer=None):
+        """Join anggota baru; referrer harus sudah terdaftar agar payout berikutnya tidak gagal."""
+        return await self._submit('add_user', user_id, user_name, staking_amount, referrer)
+
+    async def set_staking(self, user_id, staking_amount):
+        return await self._submit('set_staking', user_id, staking_amount)
+
+    async def calculate_rewards(self, days):
+        return await self._submit('calculate_rewards', days)
+
+    def report(self, user_id=None):
+        """Laporan dari snapshot terakhir; tidak pernah menunggu writer."""
+        snapshot = self.snapshot
+        if user_id is None:
+            return {'version': snapshot.version, 'days': snapshot.days,
+                    'users': len(snapshot), 'total_staked': snapshot.total_staked}
+        return snapshot[user_id]
+
+    def report_page(self, order_by='Commission', limit=50, offset=0):
+        """Satu halaman laporan dari snapshot terakhir, diurutkan dengan heap top-N."""
+        snapshot = self.snapshot
+        rows = iter_report(snapshot.items(), order_by=order_by, limit=limit, offset=offset)
+        return {'version': snapshot.version, 'offset': offset,
+                'rows': [{'user_id': user, **details} for user, details in rows]}
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            touched, results, full = set(), [], False
+            for operation, args, future in batch:
+                try:
+                    if operation == 'calculate_rewards':
+                        # Payout berjalan di thread lain; pembaca tetap dilayani dari snapshot lama
+                        days = self.mlm.days
+                        try:
+                            await loop.run_in_executor(None, self.mlm.calculate_rewards, *args)
+                        except Exception:
+                            # Payout gagal di tengah jalan: days lama dipertahankan dan payout
+                            # berikutnya dihitung ulang penuh
+                            self.mlm.days = days
+                            self.mlm._rewards_ready = False
+                            raise
+                        full = True
+                    else:
+                        user_id = args[0]
+                        if operation == 'add_user' and args[3] and args[3] not in self.mlm.users:
+                            # Dicek di writer agar referrer yang join pada batch yang sama tetap diterima
+                            raise ValueError(f"Referrer tidak terdaftar: {args[3]}")
+                        old = self.mlm.users.get(user_id)
+                        old_stake = old['staking'] if old is not None else 0
+                        getattr(self.mlm, operation)(*args)
+                        self._total_staked += self.mlm.users[user_id]['staking'] - old_stake
+                        touched.add(user_id)
+                        touched.update(self.mlm.uplines.get(user_id, ()))
+                    results.append((future, None))
+                except Exception as exc:  # Kesalahan satu operasi tidak boleh menghentikan writer
+                    results.append((future, exc))
+
+            # Commit batch: publikasikan snapshot baru sebelum menjawab writer
+            version = self.snapshot.version + 1
+            if full:
+                # Laporan penuh dibangun di thread lain; total staked disinkronkan ulang di sini
+                self.snapshot = await loop.run_in_executor(None, self._full_snapshot, version)
+                self._total_staked = self.snapshot.total_staked
+            else:
+                rows = {user_id: self._row(self.mlm.users[user_id]) for user_id in touched if user_id in self.mlm.users}
+                snapshot = self.snapshot.updated(version, rows, self._total_staked, self.mlm.days)
+                if len(snapshot.overlay) > self.overlay_limit:
+                    base = await loop.run_in_executor(None, snapshot.merged)
+                    snapshot = Snapshot(version, base, snapshot.total_staked, snapshot.days)
+                self.snapshot = snapshot
+            for future, exc in results:
+                if future.done():
+                    continue
+                if exc is None:
+                    future.set_result(version)
+                else:
+                    future.set_exception(exc)
+
+
+# --- HTTP ---
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+# Batas baris per halaman /report/page agar satu request tidak menyalin seluruh laporan
+MAX_PAGE_SIZE = 1000
+# Heap top-N menyimpan offset + limit baris, jadi offset juga dibatasi
+MAX_PAGE_OFFSET = 100_000
+MAX_BODY_SIZE = 1 << 20
+MAX_HEADERS = 100
+
+
+async def _read_request(reader):
+    """Membaca satu request; ValueError jika request tidak valid."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode('latin-1').rstrip('\r\n').split(' ')
+    if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+        raise ValueError("Baris request tidak valid")
+    method, target, _ = parts
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise ValueError("Terlalu banyak header")
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = headers.get('content-length', '0')
+    if not length.isdigit() or int(length) > MAX_BODY_SIZE:
+        raise ValueError(f"Content-Length tidak valid (maksimal {MAX_BODY_SIZE} byte)")
+    length = int(length)
+    body = await reader.readexactly(length) if length else b''
+    return method, target, headers, body
+
+
+def _response(status, payload):
+    body = json.dumps(payload).encode('utf-8')
+    head = (f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+def _user_id(value):
+    """Id user dari body JSON selalu string, sama seperti user_id pada query string."""
+    return None if value is None or value == '' else str(value)
+
+
+async def _dispatch(service, method, target, body):
+    url = urlsplit(target)
+    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    data = json.loads(body) if body else {}
+    if not isinstance(data, dict):
+        raise ValueError("Body harus berupa objek JSON")
+    if url.path == '/report' and method == 'GET':
+        user_id = query.get('user_id')
+        if user_id is not None and user_id not in service.snapshot:
+            return 404, {'error': f"User tidak ditemukan: {user_id}"}
+        return 200, service.report(user_id)
+    if url.path == '/report/page' and method == 'GET':
+        limit = min(int(query.get('limit', 50)), MAX_PAGE_SIZE)
+        offset = int(query.get('offset', 0))
+        if limit < 1 or not 0 <= offset <= MAX_PAGE_OFFSET:
+            raise ValueError(f"limit harus >= 1 dan offset antara 0 dan {MAX_PAGE_OFFSET}")
+        return 200, service.report_page(query.get('order_by', 'Commission'), limit, offset)
+    if url.path == '/users' and method == 'POST':
+        user_id = _user_id(data['user_id'])
+        version = await service.add_user(user_id, data.get('name', user_id), float(data['staking']),
+                                         _user_id(data.get('referrer')))
+        return 200, {'version': version}
+    if url.path == '/stake' and method == 'POST':
+        return 200, {'version': await service.set_staking(_user_id(data['user_id']), float(data['staking']))}
+    if url.path == '/payout' and method == 'POST':
+        return 200, {'version': await service.calculate_rewards(float(data['days']))}
+    if url.path in ('/report', '/report/page', '/users', '/stake', '/payout'):
+        return 405, {'error': f"{method} tidak didukung untuk {url.path}"}
+    return 404, {'error': f"Path tidak dikenal: {url.path}"}
+
+
+async def handle_connection(service, reader, writer):
+    """Melayani request HTTP/1.1 (keep-alive) pada satu koneksi."""
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except ValueError as exc:
+                # Setelah request rusak stream tidak bisa disinkronkan ulang: jawab 400 lalu tutup
+                writer.write(_response(400, {'error': str(exc)}))
+                await writer.drain()
+                break
+            if request is None:
+                break
+            method, target, headers, body = request
+            try:
+                status, payload = await _dispatch(service, method, target, body)
+            except KeyError as exc:
+                status, payload = 400, {'error': f"Field atau user tidak dikenal: {exc}"}
+            except (ValueError, TypeError) as exc:
+                status, payload = 400, {'error': str(exc)}
+            writer.write(_response(status, payload))
+            await writer.drain()
+            if headers.get('connection', '').lower() == 'close':
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service, host='127.0.0.1', port=8080):
+    """Menjalankan server HTTP untuk `service`; mengembalikan asyncio.Server."""
+    service.start()
+    return await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
+
+
+async def _main(args):
+    mlm = MLMSystem(incremental=True)
+    if args.input:
+        from bulk_loader import load_network
+
+        load_network(args.input, mlm)
+    server = await serve(PayoutService(mlm), args.host, args.port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Layanan HTTP payout MLMSystem")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--input', help="CSV/Parquet jaringan awal")
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,83 @@
+"""Laporan komisi yang mengalir (streaming): filter, urut, halaman, dan ekspor per chunk.
+
+Semua fungsi menerima iterable baris `(user_id, detail)` seperti yang dihasilkan
+`iter_commission_report()` (MLMSystem, CompactMLMSystem, NetworkSnapshot) atau
+`report.items()`, sehingga laporan tidak pernah dibangun utuh di memori.
+"""
+import csv
+import heapq
+import json
+from itertools import islice
+
+REPORT_FIELDS = ('Stake', 'Total Reward', 'Base Reward', 'Commission')
+
+
+def iter_report(rows, where=None, order_by=None, descending=True, limit=None, offset=0):
+    """Menghasilkan baris laporan secara lazy dengan filter, pengurutan, dan pagination.
+
+    `where(user_id, detail)` menyaring baris. Dengan `order_by` dan `limit`, hanya
+    `offset + limit` baris teratas yang disimpan di heap; tanpa `limit` pengurutan
+    penuh tetap butuh semua baris yang lolos filter.
+    """
+    if where is not None:
+        rows = (row for row in rows if where(*row))
+    if order_by is not None:
+        if order_by not in REPORT_FIELDS:
+            raise ValueError(f"Kolom laporan tidak dikenal: {order_by}")
+        key = lambda row: row[1][order_by]
+        if limit is not None:
+            select = heapq.nlargest if descending else heapq.nsmallest
+            rows = select(offset + limit, rows, key=key)
+        else:
+            rows = sorted(rows, key=key, reverse=descending)
+    stop = offset + limit if limit is not None else None
+    return islice(rows, offset, stop)
+
+
+def top_n(rows, n, field='Commission'):
+    """N baris dengan nilai `field` terbesar (default: komisi) menggunakan heap."""
+    return list(iter_report(rows, order_by=field, limit=n))
+
+
+def page(rows, number, size=50, **options):
+    """Halaman ke-`number` (mulai dari 1) berukuran `size` sebagai list."""
+    if number < 1 or size < 1:
+        raise ValueError("Nomor dan ukuran halaman harus >= 1")
+    return list(iter_report(rows, limit=size, offset=(number - 1) * size, **options))
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_csv(rows, out, chunk_size=10_000):
+    """Menulis laporan ke file CSV yang sudah terbuka per `chunk_size` baris; mengembalikan jumlah baris."""
+    writer = csv.writer(out)
+    writer.writerow(('user_id',) + REPORT_FIELDS)
+    written = 0
+    for chunk in _chunks(rows, chunk_size):
+        writer.writerows([user] + [details[field] for field in REPORT_FIELDS] for user, details in chunk)
+        written += len(chunk)
+    return written
+
+
+def write_jsonl(rows, out, chunk_size=10_000):
+    """Menulis laporan sebagai JSON Lines (satu objek per user) per `chunk_size` baris."""
+    written = 0
+    for chunk in _chunks(rows, chunk_size):
+        out.write(''.join(json.dumps({'user_id': user, **details}) + '\n' for user, details in chunk))
+        written += len(chunk)
+    return written
+
+
+def export_report(rows, path, chunk_size=10_000):
+    """Mengekspor laporan ke `path`; format dipilih dari ekstensi (.jsonl atau CSV)."""
+    with open(path, 'w', newline='') as out:
+        if path.endswith(('.jsonl', '.ndjson')):
+            return write_jsonl(rows, out, chunk_size)
+        return write_csv(rows, out, chunk_size)
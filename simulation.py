@@ -0,0 +1,102 @@
+from mlm_core import LEVEL_RATES, MAX_PAID_REFERRALS, base_reward
+
+
+class RewardSimulation:
+    """Simulasi reward hari demi hari dengan agregat berjalan.
+
+    State hanya berisi staking, parent, dan tarif komisi setiap user; setiap event
+    diterapkan dalam O(1) dan setiap hari menghasilkan agregat dalam O(1), sehingga
+    memori tidak bertambah seiring jumlah hari yang disimulasikan.
+    """
+
+    def __init__(self, mlm=None):
+        self.stakes = {}
+        self.parents = {}
+        self.child_counts = {}
+        self.rates = {}  # Total tarif komisi + royalti yang dibayarkan dari reward user ini
+        self.total_staked = 0.0
+        self.commission_base = 0.0  # Jumlah staking * tarif, dasar komisi harian
+        if mlm is not None:
+            self._load(mlm)
+
+    def _load(self, mlm):
+        """Menyalin state awal dari MLMSystem (urutan referral dipertahankan)."""
+        self.parents = dict(mlm.parents)
+        for user_id, details in mlm.users.items():
+            self.stakes[user_id] = details['staking']
+            self.total_staked += details['staking']
+        for referrer, referrals in mlm.referrals.items():
+            self.child_counts[referrer] = len(referrals)
+            for referral in referrals[:MAX_PAID_REFERRALS]:
+                rate = self._upline_rate(referrer)
+                self.rates[referral] = rate
+                self.commission_base += self.stakes[referral] * rate
+
+    def _upline_rate(self, referrer):
+        rate = 0.0
+        current_referrer = referrer
+        for level_rate in LEVEL_RATES:
+            rate += level_rate
+            current_referrer = self.parents.get(current_referrer)
+            if not current_referrer:
+                break
+        return rate
+
+    def join(self, user_id, staking_amount, referrer=None):
+        """Menambahkan anggota baru ke simulasi."""
+        if user_id in self.stakes:
+            raise ValueError(f"User {user_id} sudah terdaftar")
+        self.stakes[user_id] = staking_amount
+        self.total_staked += staking_amount
+        if referrer:
+            self.parents.setdefault(user_id, referrer)
+            count = self.child_counts.get(referrer, 0)
+            self.child_counts[referrer] = count + 1
+            if count < MAX_PAID_REFERRALS:
+                self.rates[user_id] = self._upline_rate(referrer)
+                self.commission_base += staking_amount * self.rates[user_id]
+
+    def set_staking(self, user_id, staking_amount):
+        """Mengubah staking anggota yang sudah ada."""
+        delta = staking_amount - self.stakes[user_id]
+        self.stakes[user_id] = staking_amount
+        self.total_staked += delta
+        self.commission_base += delta * self.rates.get(user_id, 0.0)
+
+    def apply(self, event):
+        """Menerapkan satu event: (hari, 'join', user_id, staking, referrer) atau (hari, 'stake', user_id, staking)."""
+        kind = event[1]
+        if kind == 'join':
+            self.join(*event[2:])
+        elif kind == 'stake':
+            self.set_staking(*event[2:])
+        else:
+            raise ValueError(f"Jenis event tidak dikenal: {kind}")
+
+    def run(self, events, days, start_day=0):
+        """Generator agregat harian untuk `days` hari mulai `start_day`.
+
+        `events` adalah iterable event yang sudah terurut berdasarkan hari; event pada
+        hari `d` berlaku sejak reward hari `d`.
+        """
+        events = iter(events)
+        pending = next(events, None)
+        cumulative_reward = 0.0
+        cumulative_commission = 0.0
+        for day in range(start_day, start_day + days):
+            while pending is not None and pending[0] <= day:
+                self.apply(pending)
+                pending = next(events, None)
+            daily_reward = base_reward(self.total_staked, 1)
+            commission = base_reward(self.commission_base, 1)
+            cumulative_reward += daily_reward
+            cumulative_commission += commission
+            yield {
+                'day': day,
+                'members': len(self.stakes),
+                'total_staked': self.total_staked,
+                'base_reward': daily_reward,
+                'commission': commission,
+                'cumulative_base_reward': cumulative_reward,
+                'cumulative_commission': cumulative_commission,
+            }
@@ -0,0 +1,187 @@
+import json
+import os
+
+import numpy as np
+
+from mlm_core import MLMSystem
+
+SNAPSHOT_VERSION = 1
+# Kolom numerik per pengguna, disimpan sebagai file .npy float64
+REWARD_COLUMNS = ('staking', 'base_reward', 'commission', 'referrer_fee', 'total_reward')
+# Pemisah string pada blob id dan nama
+SEPARATOR = '\0'
+
+
+def _write_strings(path, values):
+    text = SEPARATOR.join(values)
+    if text.count(SEPARATOR) != max(len(values) - 1, 0):
+        raise ValueError("User id dan nama tidak boleh mengandung karakter NUL")
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+
+def _read_strings(path, count):
+    # File bisa kosong untuk input valid (satu string kosong), jadi dibaca biasa tanpa mmap
+    if count == 0:
+        return []
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8').split(SEPARATOR)
+
+
+def _id_type(ids):
+    """'int' jika semua id integer, 'str' jika semua string; tipe lain ditolak agar id tidak berubah saat dimuat."""
+    if all(type(user_id) is int for user_id in ids):
+        return 'int'
+    if all(type(user_id) is str for user_id in ids):
+        return 'str'
+    raise TypeError("User id harus seluruhnya str atau seluruhnya int untuk disimpan di snapshot")
+
+
+def _null_names(names):
+    """Indeks nama None; nama selain str atau None ditolak agar nama tidak berubah saat dimuat."""
+    for name in names:
+        if name is not None and type(name) is not str:
+            raise TypeError("Nama user harus str atau None untuk disimpan di snapshot")
+    return [i for i, name in enumerate(names) if name is None]
+
+
+def save_snapshot(mlm, path):
+    """Menyimpan pengguna, edge referral, dan reward terakhir MLMSystem ke direktori `path`.
+
+    User id disimpan sebagai int64 jika semuanya integer, selain itu sebagai string;
+    nama disimpan sebagai string dengan indeks nama None dicatat terpisah.
+    """
+    user_ids = list(mlm.users)
+    # Referrer yang belum terdaftar sebagai user tetap disimpan setelah daftar user
+    extra_ids = [referrer for referrer in mlm.referrals if referrer not in mlm.users]
+    all_ids = user_ids + extra_ids
+    id_type = _id_type(all_ids)
+    os.makedirs(path, exist_ok=True)
+    index = {user_id: i for i, user_id in enumerate(all_ids)}
+
+    for column in REWARD_COLUMNS:
+        values = np.fromiter((details[column] for details in mlm.users.values()), dtype=np.float64, count=len(user_ids))
+        np.save(os.path.join(path, f'{column}.npy'), values)
+
+    edge_src, edge_dst = [], []
+    for referrer, referrals in mlm.referrals.items():
+        for referral in referrals:
+            edge_src.append(index[referrer])
+            edge_dst.append(index[referral])
+    np.save(os.path.join(path, 'edge_src.npy'), np.asarray(edge_src, dtype=np.int64))
+    np.save(os.path.join(path, 'edge_dst.npy'), np.asarray(edge_dst, dtype=np.int64))
+    parent = [index[mlm.parents[user_id]] if user_id in mlm.parents else -1 for user_id in user_ids]
+    np.save(os.path.join(path, 'parent.npy'), np.asarray(parent, dtype=np.int64))
+
+    if id_type == 'int':
+        np.save(os.path.join(path, 'ids.npy'), np.asarray(all_ids, dtype=np.int64))
+    else:
+        _write_strings(os.path.join(path, 'ids.bin'), all_ids)
+    names = [details['name'] for details in mlm.users.values()]
+    null_names = _null_names(names)
+    _write_strings(os.path.join(path, 'names.bin'), [name or '' for name in names])
+    np.save(os.path.join(path, 'null_names.npy'), np.asarray(null_names, dtype=np.int64))
+    meta = {
+        'version': SNAPSHOT_VERSION,
+        'users': len(user_ids),
+        'ids': len(all_ids),
+        'id_type': id_type,
+        'days': mlm.days,
+        'rewards_ready': mlm._rewards_ready,
+    }
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+
+
+class NetworkSnapshot:
+    """Snapshot jaringan yang dimuat dengan memory map; kolom numerik tidak disalin ke memori.
+
+    String (id dan nama) baru di-decode saat pertama kali dibutuhkan.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        if self.meta['version'] != SNAPSHOT_VERSION:
+            raise ValueError(f"Versi snapshot tidak didukung: {self.meta['version']}")
+        self.days = self.meta['days']
+        self.columns = {column: self._map(column) for column in REWARD_COLUMNS}
+        self.edge_src = self._map('edge_src')
+        self.edge_dst = self._map('edge_dst')
+        self.parent = self._map('parent')
+        self._ids = None
+        self._names = None
+
+    def _map(self, name):
+        return np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')
+
+    def __len__(self):
+        return self.meta['users']
+
+    @property
+    def ids(self):
+        """Seluruh id (user terdaftar lalu referrer yang belum terdaftar)."""
+        if self._ids is None:
+            # Snapshot lama tanpa id_type selalu menyimpan id sebagai string
+            if self.meta.get('id_type', 'str') == 'int':
+                self._ids = self._map('ids').tolist()
+            else:
+                self._ids = _read_strings(os.path.join(self.path, 'ids.bin'), self.meta['ids'])
+        return self._ids
+
+    @property
+    def names(self):
+        if self._names is None:
+            names = _read_strings(os.path.join(self.path, 'names.bin'), self.meta['users'])
+            # Snapshot lama tanpa null_names.npy tidak pernah menyimpan nama None
+            null_names = os.path.join(self.path, 'null_names.npy')
+            if os.path.exists(null_names):
+                for i in np.load(null_names).tolist():
+                    names[i] = None
+            self._names = names
+        return self._names
+
+    def total_staked(self):
+        """Menghitung jumlah total yang di-stake oleh semua pengguna."""
+        return float(self.columns['staking'].sum())
+
+    def iter_commission_report(self, chunk_size=65_536):
+        """Menghasilkan baris laporan komisi; kolom mmap dikonversi per `chunk_size` baris."""
+        columns = self.columns
+        ids = self.ids
+        for start in range(0, self.meta['users'], chunk_size):
+            stop = start + chunk_size
+            yield from (
+                (user, {'Stake': stake, 'Total Reward': total_reward, 'Base Reward': base_reward, 'Commission': commission})
+                for user, stake, total_reward, base_reward, commission in zip(
+                    ids[start:stop], columns['staking'][start:stop].tolist(), columns['total_reward'][start:stop].tolist(),
+                    columns['base_reward'][start:stop].tolist(), columns['commission'][start:stop].tolist()))
+
+    def get_commission_report(self):
+        """Mengembalikan laporan komisi untuk setiap pengguna, termasuk stake mereka."""
+        return dict(self.iter_commission_report())
+
+    def to_system(self, **kwargs):
+        """Membangun kembali MLMSystem lengkap (dapat diubah) dari snapshot."""
+        mlm = MLMSystem(**kwargs)
+        ids = self.ids
+        values = [self.columns[column].tolist() for column in REWARD_COLUMNS]
+        for user_id, name, *row in zip(ids, self.names, *values):
+            details = {'name': name}
+            details.update(zip(REWARD_COLUMNS, row))
+            mlm.users[user_id] = details
+        for src, dst in zip(self.edge_src.tolist(), self.edge_dst.tolist()):
+            mlm.referrals.setdefault(ids[src], []).append(ids[dst])
+        for user_id, parent in zip(ids, self.parent.tolist()):
+            if parent >= 0:
+                mlm.parents[user_id] = ids[parent]
+        mlm._rebuild_aggregates()
+        mlm.days = self.days
+        mlm._rewards_ready = self.meta['rewards_ready']
+        return mlm
+
+
+def load_snapshot(path):
+    """Memuat snapshot dari direktori `path` menggunakan memory map."""
+    return NetworkSnapshot(path)
@@ -0,0 +1,115 @@
+import time
+from bisect import bisect_left, bisect_right, insort
+
+from mlm_core import ANNUAL_RATE, DAYS_PER_YEAR
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+# Reward staking dihitung per detik untuk periode parsial
+SECONDS_PER_YEAR = DAYS_PER_YEAR * 24 * 3600
+
+
+class _SortedIndex:
+    """Fallback indeks terurut berbasis bisect bila sortedcontainers tidak terpasang; add/remove O(N)."""
+
+    def __init__(self):
+        self._items = []
+
+    def add(self, item):
+        insort(self._items, item)
+
+    def remove(self, item):
+        del self._items[bisect_right(self._items, item) - 1]
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+
+class _Timeline:
+    """Catatan (waktu, jumlah) terurut dengan prefix sum untuk query rentang dan akrual O(log N)."""
+
+    def __init__(self):
+        self.timestamps = []
+        self.amounts = [0.0]  # prefix sum jumlah
+        self.weighted = [0.0]  # prefix sum jumlah * waktu
+
+    def append(self, timestamp, amount):
+        self.timestamps.append(timestamp)
+        self.amounts.append(self.amounts[-1] + amount)
+        self.weighted.append(self.weighted[-1] + amount * timestamp)
+
+    def amount_between(self, start, end):
+        lo = bisect_left(self.timestamps, start) if start is not None else 0
+        hi = bisect_right(self.timestamps, end) if end is not None else len(self.timestamps)
+        return self.amounts[hi] - self.amounts[lo] if hi > lo else 0.0
+
+    def accrued(self, until):
+        """Reward yang terakumulasi sampai `until`, setiap stake dihitung sejak waktu stake dibuat."""
+        count = bisect_right(self.timestamps, until)
+        stake_seconds = until * self.amounts[count] - self.weighted[count]
+        return stake_seconds * ANNUAL_RATE / SECONDS_PER_YEAR
+
+
+class StakingLedger:
+    """Ledger staking append-only dengan total berjalan dan indeks terurut berdasarkan jumlah.
+
+    total_staked O(1), top_stakers O(log N + K), staked_between dan accrued_reward O(log N).
+    record O(log N) bila sortedcontainers terpasang; tanpa itu indeks fallback berbasis
+    list membuat setiap record O(N).
+    """
+
+    def __init__(self):
+        self.entries = []  # (waktu, address, jumlah), tidak pernah diubah
+        self.positions = {}  # address -> total stake
+        self.total = 0
+        self._index = SortedList() if SortedList is not None else _SortedIndex()
+        self._timeline = _Timeline()
+        self._timelines = {}  # address -> _Timeline
+
+    def record(self, address, amount, timestamp=None):
+        """Mencatat stake baru; waktu harus tidak lebih awal dari entri sebelumnya.
+
+        Tanpa `timestamp` dipakai waktu sekarang, dibatasi minimal waktu entri terakhir
+        agar stake tetap tercatat bila jam sistem mundur.
+        """
+        if timestamp is None:
+            timestamp = max(time.time(), self.entries[-1][0]) if self.entries else time.time()
+        elif self.entries and timestamp < self.entries[-1][0]:
+            raise ValueError("Entri ledger harus dicatat berurutan menurut waktu")
+        self.entries.append((timestamp, address, amount))
+        self.total += amount
+
+        old = self.positions.get(address)
+        if old is not None:
+            self._index.remove((old, address))
+        self.positions[address] = (old or 0) + amount
+        self._index.add((self.positions[address], address))
+
+        self._timeline.append(timestamp, amount)
+        self._timelines.setdefault(address, _Timeline()).append(timestamp, amount)
+
+    def total_staked(self):
+        """Total stake seluruh address, O(1)."""
+        return self.total
+
+    def top_stakers(self, k):
+        """K address dengan stake terbesar, terurut menurun."""
+        count = len(self._index)
+        top = [self._index[i] for i in range(count - 1, max(count - k, 0) - 1, -1)]
+        return [(address, amount) for amount, address in top]
+
+    def staked_between(self, start=None, end=None):
+        """Total stake yang dibuat dalam rentang waktu [start, end]."""
+        return self._timeline.amount_between(start, end)
+
+    def accrued_reward(self, address=None, until=None):
+        """Reward staking sampai `until` (default sekarang) untuk satu address atau seluruh ledger."""
+        until = time.time() if until is None else until
+        timeline = self._timeline if address is None else self._timelines.get(address)
+        return timeline.accrued(until) if timeline else 0.0
@@ -1,25 +1,78 @@
-from eth_account import Account
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+
+from eth_keys import keys
+
+from staking_ledger import StakingLedger
+
+
+def _derive_keys(private_keys):
+    """Menurunkan (public key, address) dari daftar private key; dijalankan di proses worker."""
+    derived = []
+    for private_key in private_keys:
+        public_key = keys.PrivateKey(private_key).public_key
+        derived.append((public_key.to_bytes(), public_key.to_checksum_address()))
+    return derived
+
 
 class Refferals:
     def __init__(self):
         self.minimumStakes = 100
         self.stakers = {}
         self.users = {}
-    def stake(self, User, amount):
+        self.ledger = StakingLedger()
+    def stake(self, User, amount, timestamp=None):
         if User.balance >= self.minimumStakes and User.balance >= amount:
-            self.stakers[User.address] = amount
+            # Setiap stake dicatat di ledger; stakers menyimpan total posisi per address
+            self.ledger.record(User.address, amount, timestamp)
+            self.stakers[User.address] = self.ledger.positions[User.address]
             User.balance -= amount
             return True
+    def total_staked(self):
+        return self.ledger.total_staked()
+    def top_stakers(self, k):
+        return self.ledger.top_stakers(k)
+    @classmethod
+    def create_users(cls, count, workers=None, lazy=False, chunk_size=1000):
+        """Membuat banyak User sekaligus; setiap key pair diturunkan tepat satu kali.
+
+        Penurunan key dibagi ke ProcessPoolExecutor per `chunk_size` user. Dengan lazy=True
+        penurunan ditunda sampai `address`/`public_key` user pertama kali diakses.
+        """
+        private_keys = [secrets.token_bytes(32) for _ in range(count)]
+        if lazy:
+            return [cls.User(private_key) for private_key in private_keys]
+        chunks = [private_keys[i:i + chunk_size] for i in range(0, count, chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            derived = [pair for chunk in executor.map(_derive_keys, chunks) for pair in chunk]
+        return [cls.User(private_key, public_key, address)
+                for private_key, (public_key, address) in zip(private_keys, derived)]
     class User:
-        def __init__(self):
-            self.private_key = Account.create().privateKey
-            self.public_key = Account.privateKeyToAccount(self.private_key).publicKey
-            self.address = Account.privateKeyToAccount(self.private_key).address
+        def __init__(self, private_key=None, public_key=None, address=None):
+            self.private_key = private_key if private_key is not None else secrets.token_bytes(32)
+            self._public_key = public_key
+            self._address = address
             self.balance = 0
             self.uplinerIds = 0
             self.downlines = {}
             self.minimumStakes = 100
             self.stakers = {}
+        def _derive(self):
+            # Satu kali perkalian kurva eliptik untuk public key; address diturunkan dari public key
+            public_key = keys.PrivateKey(bytes(self.private_key)).public_key
+            self._public_key = public_key.to_bytes()
+            self._address = public_key.to_checksum_address()
+        @property
+        def public_key(self):
+            if self._public_key is None:
+                self._derive()
+            return self._public_key
+        @property
+        def address(self):
+            if self._address is None:
+                self._derive()
+            return self._address
         def add_upliner(self, upliner_id):
             if upliner_id not in self.downlines:
                 if self.uplinerIds == 0:
@@ -27,4 +80,5 @@ class Refferals:
         def isUserHasUpliner(self, user_id):
             if self.uplinerId is not 0:
                 return True
-        def add_downliner(self, upliner_id, downliner_id):
\ No newline at end of file
+        def add_downliner(self, upliner_id, downliner_id):
+            pass
@@ -9,6 +9,10 @@ class MLMSystem:
         self.users = {}
         # Menyimpan struktur pohon referral
         self.referrals = {}
+        # Indeks parent (anak -> referrer) agar pencarian upline tidak memindai seluruh pohon
+        self.parents = {}
+        # Tabel upline: user -> tuple maksimal 3 upline di atas referrer-nya, dibangun ulang bila jaringan berubah
+        self.uplines = None
         self.commissions = {}
         self.days = 0
 
@@ -26,6 +30,8 @@ class MLMSystem:
                 self.referrals[referrer].append(user_id)
             else:
                 self.referrals[referrer] = [user_id]
+            self.parents.setdefault(user_id, referrer)
+        self.uplines = None
 
     def calculate_rewards(self, days):
         """Menghitung rewards, komisi, dan royalti untuk semua pengguna."""
@@ -34,6 +40,8 @@ class MLMSystem:
 
         # Reset komisi setiap kali fungsi ini dipanggil
         self.commissions = {}
+        if self.uplines is None:
+            self.build_uplines()
 
         for referrer, referrals in self.referrals.items():
             for level, referral in enumerate(referrals):
@@ -43,25 +51,30 @@ class MLMSystem:
         for user, details in self.users.items():
             details['total_reward'] = details['base_reward'] - details['commission']
 
-    def calculate_commission_and_royalty(self, referrer, referral, level):
-        """Rekursif menghitung komisi dan royalti hingga 4 level."""
-        if level > 4:
-            return  # Batasi hingga 4 level, level 4 tidak menerima apa-apa
+    def build_uplines(self):
+        """Membangun tabel upline untuk setiap user yang memiliki referrer."""
+        self.uplines = {}
+        for user_id in self.parents:
+            chain = []
+            current = self.parents.get(user_id)
+            while current and len(chain) < 3:
+                chain.append(current)
+                current = self.parents.get(current)
+            self.uplines[user_id] = tuple(chain)
 
+    def calculate_commission_and_royalty(self, referrer, referral, level):
+        """Menghitung komisi dan royalti hingga 4 level menggunakan tabel upline."""
         referral_reward = self.users[referral]['base_reward']
-        commission_rate = [0.05, 0.03, 0.02, 0][level - 1]  # Tarif komisi untuk setiap level
-        commission = referral_reward * commission_rate
-
-        # Rekam komisi untuk setiap referrer dan referral
-        self.users[referrer]['commission'] += commission
-        if referrer not in self.commissions:
-            self.commissions[referrer] = {}
-        self.commissions[referrer][referral] = commission
-
-        # Lanjutkan ke parent referrer jika belum mencapai level 4
-        parent_referrer = next((key for key, value in self.referrals.items() if referrer in value), None)
-        if parent_referrer:
-            self.calculate_commission_and_royalty(parent_referrer, referral, level + 1)
+        uplines = (referrer,) + self.uplines.get(referrer, ())
+        for level, upline in enumerate(uplines[:5 - level], start=level):
+            commission_rate = [0.05, 0.03, 0.02, 0][level - 1]  # Tarif komisi untuk setiap level, level 4 tidak menerima apa-apa
+            commission = referral_reward * commission_rate
+
+            # Rekam komisi untuk setiap referrer dan referral
+            self.users[upline]['commission'] += commission
+            if upline not in self.commissions:
+                self.commissions[upline] = {}
+            self.commissions[upline][referral] = commission
 
     def get_commission_report(self):
         return {user: {'Stake': details['staking'], 'Total Reward': details['total_reward'], 'Commission': details['commission']} for user, details in self.users.items()}